@@ -11,10 +11,21 @@ Versão: 1.0.0
 """
 
 import os
+import threading
 from typing import Optional, Callable
 from pathlib import Path
 
-from ..engines.ffmpeg_engine import run_ffmpeg_conversion, get_file_info, is_ffmpeg_available
+from ..engines.ffmpeg_engine import run_ffmpeg_conversion, get_file_info, is_ffmpeg_available, muxer_for_extension
+
+# Preset do engine FFmpeg (CRF) correspondente a cada preset deste conversor;
+# os rótulos da interface ('Alta', 'Média', 'Baixa') já são presets do engine
+ENGINE_QUALITY = {
+    'baixa': 'Baixa',
+    'media': 'Média',
+    'alta': 'Alta',
+    'maxima': 'Alta',
+    'Máxima': 'Alta'
+}
 
 
 class AudioConverter:
@@ -109,7 +120,8 @@ class AudioConverter:
         output_path: str,
         target_format: str,
         quality: str = 'media',
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        cancel_event: Optional[threading.Event] = None
     ) -> tuple[bool, str]:
         """Converte um arquivo de áudio.
         
@@ -119,6 +131,7 @@ class AudioConverter:
             target_format: Formato de saída (mp3, wav, etc.)
             quality: Preset de qualidade (baixa, media, alta, maxima)
             progress_callback: Callback para progresso
+            cancel_event: Evento que, quando acionado, encerra o FFmpeg em andamento
             
         Returns:
             Tupla (sucesso, mensagem)
@@ -140,27 +153,27 @@ class AudioConverter:
             # Obter configuração do formato
             format_config = self.format_configs.get(target_format, {})
             
-            # Preparar parâmetros específicos para áudio
-            extra_params = {
-                'audio_bitrate': preset['bitrate'],
-                'sample_rate': preset['sample_rate'],
-                'channels': preset['channels']
-            }
-            
-            # Adicionar codec específico se disponível
-            if 'codec' in format_config:
-                extra_params['audio_codec'] = format_config['codec']
+            # Taxa de amostragem e canais do preset não são aplicados (o engine não
+            # os aceita); o arquivo mantém os da entrada
+            if progress_callback:
+                progress_callback(0, f"Convertendo {Path(input_path).name}")
             
             # Executar conversão
             success, message = run_ffmpeg_conversion(
                 input_path=input_path,
                 output_path=output_path,
-                target_format=target_format,
-                quality=quality,
-                progress_callback=progress_callback,
-                **extra_params
+                quality_preset=ENGINE_QUALITY.get(quality, quality),
+                format_type='audio',
+                output_format=muxer_for_extension(target_format),
+                cancel_event=cancel_event,
+                audio_codec=format_config.get('codec'),
+                audio_bitrate=preset['bitrate']
             )
             
+            # O FFmpeg não informa progresso intermediário; só o fim é reportado
+            if success and progress_callback:
+                progress_callback(100, message)
+            
             return success, message
             
         except Exception as e:
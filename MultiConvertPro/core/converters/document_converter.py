@@ -13,12 +13,14 @@ Versão: 1.0.0
 
 import os
 import subprocess
+import threading
 from typing import Optional, Callable
 from pathlib import Path
 
 from ..engines.onlyoffice_engine import OnlyOfficeEngine
 from ..engines.libreoffice_engine import LibreOfficeEngine
 from ..engines.fallback_engine import FallbackEngine
+from ..engines.process_utils import CANCELLED_MESSAGE
 
 
 class DocumentConverter:
@@ -242,7 +244,8 @@ class DocumentConverter:
         output_path: str,
         target_format: str,
         quality: str = 'media',
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        cancel_event: Optional[threading.Event] = None
     ) -> tuple[bool, str]:
         """Converte um arquivo de documento usando sistema de fallback.
         
@@ -252,6 +255,8 @@ class DocumentConverter:
             target_format: Formato de saída (pdf, docx, etc.)
             quality: Preset de qualidade (baixa, media, alta, maxima)
             progress_callback: Callback para progresso
+            cancel_event: Evento de parada; interrompe o OnlyOffice e o soffice
+                da linha de comando em andamento e impede a tentativa dos engines seguintes
             
         Returns:
             Tupla (sucesso, mensagem)
@@ -294,6 +299,9 @@ class DocumentConverter:
             
             # Tentar cada engine na ordem de prioridade
             for i, engine in enumerate(engines_to_try):
+                if cancel_event is not None and cancel_event.is_set():
+                    return False, CANCELLED_MESSAGE
+                
                 engine_name = engine.__class__.__name__.replace('Engine', '')
                 
                 if progress_callback:
@@ -310,13 +318,14 @@ class DocumentConverter:
                             progress_callback=lambda p, m: progress_callback(current_progress + p * progress_step / 100, m) if progress_callback else None
                         )
                     else:
-                        # OnlyOffice e LibreOffice usam parâmetros padrão
+                        # OnlyOffice e LibreOffice usam parâmetros padrão e aceitam cancelamento
                         success, message = engine.convert(
                             input_path=input_path,
                             output_path=output_path,
                             target_format=target_format,
                             quality=quality,
-                            progress_callback=lambda p, m: progress_callback(current_progress + p * progress_step / 100, m) if progress_callback else None
+                            progress_callback=lambda p, m: progress_callback(current_progress + p * progress_step / 100, m) if progress_callback else None,
+                            cancel_event=cancel_event
                         )
                     
                     if success:
@@ -11,9 +11,12 @@ Versão: 1.0.0
 """
 
 import os
+import threading
 from typing import Optional, Callable, Tuple
 from pathlib import Path
 
+from ..engines.process_utils import CANCELLED_MESSAGE
+
 try:
     from PIL import Image, ImageOps, ImageEnhance, ExifTags
     PIL_AVAILABLE = True
@@ -138,6 +141,7 @@ class ImageConverter:
         target_format: str,
         quality: str = 'media',
         progress_callback: Optional[Callable] = None,
+        cancel_event: Optional[threading.Event] = None,
         **kwargs
     ) -> tuple[bool, str]:
         """Converte um arquivo de imagem.
@@ -148,6 +152,8 @@ class ImageConverter:
             target_format: Formato de saída (jpg, png, etc.)
             quality: Preset de qualidade (baixa, media, alta, maxima)
             progress_callback: Callback para progresso
+            cancel_event: Evento de parada, verificado antes de abrir a imagem
+                (a conversão no Pillow é curta e não é interrompida no meio)
             **kwargs: Parâmetros adicionais (resize, rotate, etc.)
             
         Returns:
@@ -164,6 +170,9 @@ class ImageConverter:
             if not os.path.exists(input_path):
                 return False, f"Arquivo não encontrado: {input_path}"
             
+            if cancel_event is not None and cancel_event.is_set():
+                return False, CANCELLED_MESSAGE
+            
             if progress_callback:
                 progress_callback(10, "Abrindo imagem...")
             
@@ -1,4 +1,6 @@
 import os
+import mmap
+import threading
 from pathlib import Path
 from typing import List, Dict, Callable, Optional
 import filetype
@@ -9,6 +11,37 @@ from .audio_converter import AudioConverter
 from .image_converter import ImageConverter
 from .document_converter import DocumentConverter
 
+# Tipos cujos conversores podem rodar em paralelo: os conversores de mídia não
+# guardam estado por conversão (cada chamada inicia seu próprio processo FFmpeg
+# ou abre sua própria imagem), então uma única instância atende várias threads.
+# Documentos ficam de fora: o DocumentConverter compartilha um único engine
+# OnlyOffice/LibreOffice e o daemon UNO entre as conversões
+PARALLEL_SAFE_TYPES = frozenset({'video', 'audio', 'image'})
+
+# Bytes do cabeçalho examinados na detecção de tipo pelo conteúdo
+HEADER_SNIFF_SIZE = 8192
+
+
+def _read_header(file_path: str, size: int = HEADER_SNIFF_SIZE) -> bytes:
+    """Lê o início do arquivo por mmap, paginando apenas o cabeçalho.
+    
+    Args:
+        file_path: Caminho do arquivo
+        size: Quantidade máxima de bytes lidos
+        
+    Returns:
+        Bytes iniciais do arquivo (vazio para arquivos vazios)
+    """
+    with open(file_path, 'rb') as file:
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(file.fileno(), 0, size, os.POSIX_FADV_SEQUENTIAL)
+        try:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return mapped[:size]
+        except ValueError:
+            # Arquivos vazios não podem ser mapeados
+            return b''
+
 class ConversionJob:
     """Representa um trabalho de conversão individual."""
     
@@ -89,7 +122,7 @@ class MainConverter:
                 return self.extension_mapping[extension]
             
             # Se não encontrou pela extensão, tentar detectar pelo conteúdo
-            kind = filetype.guess(file_path)
+            kind = filetype.guess(_read_header(file_path))
             if kind is not None:
                 mime_type = kind.mime
                 if mime_type.startswith('video/'):
@@ -187,6 +220,60 @@ class MainConverter:
                 self.status_callback(f"Erro ao adicionar conversão: {str(e)}")
             return False
     
+    def is_parallel_safe(self, file_path: str) -> bool:
+        """Indica se o arquivo pode ser convertido em paralelo com outros."""
+        return self.detect_file_type(file_path) in PARALLEL_SAFE_TYPES
+    
+    def convert_one(
+        self,
+        input_path: str,
+        output_dir: str,
+        target_format: str,
+        quality: str = 'media',
+        progress_callback: Optional[Callable] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> tuple[bool, str]:
+        """Converte um único arquivo fora da fila de jobs.
+        
+        Não altera a fila nem o estado da conversão em série, podendo ser
+        chamado por várias threads ao mesmo tempo. Por isso só aceita arquivos
+        de PARALLEL_SAFE_TYPES; documentos passam pela fila em série.
+        
+        Args:
+            input_path: Caminho do arquivo de entrada
+            output_dir: Pasta onde o arquivo convertido será gravado
+            target_format: Formato de saída
+            quality: Preset de qualidade (baixa, media, alta, maxima)
+            progress_callback: Callback para progresso do arquivo
+            cancel_event: Evento que, quando acionado, encerra o processo externo em andamento
+            
+        Returns:
+            Tupla (sucesso, mensagem)
+        """
+        try:
+            input_file = Path(input_path)
+            input_extension = input_file.suffix.lower().lstrip('.')
+            file_type = self.detect_file_type(input_path)
+            if file_type not in PARALLEL_SAFE_TYPES:
+                return False, f"Arquivos do tipo {file_type} não podem ser convertidos em paralelo: {input_file.name}"
+            
+            converter = self.get_converter_for_type(file_type)
+            
+            if converter is None or not self.is_format_supported(input_extension, target_format):
+                return False, f"Conversão {input_extension} → {target_format} não suportada: {input_file.name}"
+            
+            output_path = os.path.join(output_dir, f"{input_file.stem}.{target_format.lower()}")
+            return converter.convert(
+                input_path=input_path,
+                output_path=output_path,
+                target_format=target_format,
+                quality=quality,
+                progress_callback=progress_callback,
+                cancel_event=cancel_event
+            )
+        except Exception as e:
+            return False, f"Erro durante a conversão: {str(e)}"
+    
     def clear_jobs(self):
         """Limpa todos os trabalhos da fila."""
         if not self.is_converting:
@@ -312,9 +399,13 @@ class MainConverter:
         
         return True
     
-    def process_next_job(self) -> tuple[bool, bool]:  # (success, has_more_jobs)
+    def process_next_job(self, stop_event: Optional[threading.Event] = None) -> tuple[bool, bool]:  # (success, has_more_jobs)
         """Processa o próximo trabalho na fila usando conversores especializados.
         
+        Args:
+            stop_event: Evento de parada repassado ao conversor; encerra o
+                processo externo (FFmpeg, soffice, DocumentBuilder) em andamento
+        
         Returns:
             tuple: (sucesso do job atual, há mais jobs para processar)
         """
@@ -377,7 +468,8 @@ class MainConverter:
                             output_path=current_job.output_path,
                             target_format=current_job.target_format,
                             quality=current_job.quality,
-                            progress_callback=progress_update
+                            progress_callback=progress_update,
+                            cancel_event=stop_event
                         )
                         print(f"DEBUG: Resultado da conversão: success={success}, message={message}")
         
@@ -11,10 +11,21 @@ Versão: 1.0.0
 """
 
 import os
+import threading
 from typing import Optional, Callable
 from pathlib import Path
 
-from ..engines.ffmpeg_engine import run_ffmpeg_conversion, get_file_info, is_ffmpeg_available
+from ..engines.ffmpeg_engine import run_ffmpeg_conversion, get_file_info, is_ffmpeg_available, muxer_for_extension
+
+# Preset do engine FFmpeg (CRF) correspondente a cada preset deste conversor;
+# os rótulos da interface ('Alta', 'Média', 'Baixa') já são presets do engine
+ENGINE_QUALITY = {
+    'baixa': 'Baixa',
+    'media': 'Média',
+    'alta': 'Alta',
+    'maxima': 'Alta',
+    'Máxima': 'Alta'
+}
 
 
 class VideoConverter:
@@ -102,7 +113,8 @@ class VideoConverter:
         output_path: str,
         target_format: str,
         quality: str = 'media',
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        cancel_event: Optional[threading.Event] = None
     ) -> tuple[bool, str]:
         """Converte um arquivo de vídeo.
         
@@ -112,6 +124,7 @@ class VideoConverter:
             target_format: Formato de saída (mp4, avi, etc.)
             quality: Preset de qualidade (baixa, media, alta, maxima)
             progress_callback: Callback para progresso
+            cancel_event: Evento que, quando acionado, encerra o FFmpeg em andamento
             
         Returns:
             Tupla (sucesso, mensagem)
@@ -130,30 +143,26 @@ class VideoConverter:
             # Obter preset de qualidade
             preset = self.quality_presets.get(quality, self.quality_presets['media'])
             
-            # Preparar parâmetros específicos para vídeo
-            extra_params = {
-                'video_bitrate': preset['video_bitrate'],
-                'audio_bitrate': preset['audio_bitrate']
-            }
-            
-            # Adicionar resolução se especificada
-            if preset['resolution'] != 'original':
-                extra_params['resolution'] = preset['resolution']
-            
-            # Adicionar FPS se especificado
-            if preset['fps'] != 'original':
-                extra_params['fps'] = preset['fps']
+            # O engine controla a qualidade do vídeo pelo CRF do preset; bitrate de
+            # vídeo, resolução e FPS do preset não são aplicados (o engine não os aceita)
+            if progress_callback:
+                progress_callback(0, f"Convertendo {Path(input_path).name}")
             
             # Executar conversão
             success, message = run_ffmpeg_conversion(
                 input_path=input_path,
                 output_path=output_path,
-                target_format=target_format,
-                quality=quality,
-                progress_callback=progress_callback,
-                **extra_params
+                quality_preset=ENGINE_QUALITY.get(quality, quality),
+                format_type='video',
+                output_format=muxer_for_extension(target_format),
+                cancel_event=cancel_event,
+                audio_bitrate=preset['audio_bitrate']
             )
             
+            # O FFmpeg não informa progresso intermediário; só o fim é reportado
+            if success and progress_callback:
+                progress_callback(100, message)
+            
             return success, message
             
         except Exception as e:
@@ -76,6 +76,12 @@ class FallbackEngine:
             ('rtf', 'txt'): self._rtf_to_text,
             ('rtf', 'docx'): self._rtf_to_docx,
         }
+        
+        # Tabela de despacho achatada (chave "entrada>saida") para lookup com um único hash
+        self._dispatch = {
+            f"{input_fmt}>{output_fmt}": func
+            for (input_fmt, output_fmt), func in self.conversion_matrix.items()
+        }
     
     def is_available(self) -> bool:
         """Verifica se pelo menos uma biblioteca está disponível."""
@@ -87,8 +93,7 @@ class FallbackEngine:
     
     def can_convert(self, input_format: str, output_format: str) -> bool:
         """Verifica se uma conversão específica é suportada."""
-        conversion_key = (input_format.lower(), output_format.lower())
-        return conversion_key in self.conversion_matrix
+        return f"{input_format.lower()}>{output_format.lower()}" in self._dispatch
     
     def convert(
         self,
@@ -115,8 +120,8 @@ class FallbackEngine:
                 progress_callback(10, "Iniciando conversão com bibliotecas Python...")
             
             # Verificar se a conversão é suportada
-            conversion_key = (input_format.lower(), output_format.lower())
-            if conversion_key not in self.conversion_matrix:
+            converter_func = self._dispatch.get(f"{input_format.lower()}>{output_format.lower()}")
+            if converter_func is None:
                 return False, f"Conversão {input_format} → {output_format} não suportada pelo engine de fallback"
             
             # Verificar se o arquivo de entrada existe
@@ -132,7 +137,6 @@ class FallbackEngine:
                 os.makedirs(output_dir, exist_ok=True)
             
             # Executar conversão específica
-            converter_func = self.conversion_matrix[conversion_key]
             success, message = converter_func(input_path, output_path, progress_callback)
             
             if success and progress_callback:
@@ -1,82 +1,511 @@
 import subprocess
 import os
+import sys
+import asyncio
+import ctypes
+import functools
+import json
+import tempfile
+import threading
+import time
 from pathlib import Path
 
-def run_ffmpeg_conversion(input_path, output_path, quality_preset='medium', format_type='video'):
+from .process_utils import (
+    popen_kwargs, lower_priority, communicate, ProcessCancelled, CANCELLED_MESSAGE, CANCEL_POLL_INTERVAL
+)
+
+# Parser JSON em C (orjson) quando instalado, para a saída do ffprobe
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Executáveis empacotados em <raiz do projeto>/bin (resolvidos uma única vez)
+_BIN_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'bin')
+_FFMPEG_PATH = os.path.join(_BIN_DIR, 'ffmpeg.exe')
+_FFPROBE_PATH = os.path.join(_BIN_DIR, 'ffprobe.exe')
+
+# Tamanho dos blocos/buffers usados ao trafegar dados pelos pipes do FFmpeg
+PIPE_BUFSIZE = 1 << 20
+
+# Encoders H.264 de hardware em ordem de preferência (nome curto -> encoder do FFmpeg)
+HW_ENCODERS = {
+    'nvenc': 'h264_nvenc',
+    'qsv': 'h264_qsv',
+    'amf': 'h264_amf',
+    'videotoolbox': 'h264_videotoolbox'
+}
+
+# Qualidade do VideoToolbox (-q:v 1-100, maior é melhor) equivalente ao CRF do libx264
+_VIDEOTOOLBOX_QUALITY = {'18': '65', '23': '55', '28': '45'}
+
+# Mapeia presets de qualidade para o CRF do FFmpeg
+QUALITY_CRF = {
+    'Alta': '18',
+    'Média': '23',  # Valor padrão
+    'Baixa': '28'
+}
+
+# Nome do muxer do FFmpeg (-f) para extensões que não coincidem com ele
+_EXT_MUXERS = {
+    'mkv': 'matroska',
+    'm4a': 'ipod',
+    'aac': 'adts',
+    'wmv': 'asf',
+    'ogv': 'ogg'
+}
+
+# Containers que recebem '-movflags +faststart' (índice moov no início do arquivo)
+_FASTSTART_EXTS = frozenset({'.mp4', '.m4v', '.mov'})
+
+# Extensões para detecção rápida do tipo de formato
+_VIDEO_EXTS = frozenset({'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm'})
+_AUDIO_EXTS = frozenset({'.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a'})
+_IMAGE_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp'})
+
+# Extensões cujo conteúdo pode ser vídeo ou apenas áudio (exigem ffprobe)
+_AMBIGUOUS_EXTS = frozenset({'.ts', '.ogg', '.webm'})
+
+# Direitos de acesso do Win32 necessários para SetProcessAffinityMask
+_PROCESS_SET_INFORMATION = 0x0200
+_PROCESS_QUERY_INFORMATION = 0x0400
+
+def _available_cpus():
+    """Retorna a lista de núcleos que este processo pode usar."""
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+def _pin_process(pid, cpu_set):
     """
-    Executa a conversão usando FFmpeg.
+    Restringe um processo em execução aos núcleos informados (melhor esforço).
+    
+    Usa sched_setaffinity no Linux e SetProcessAffinityMask no Windows; nos
+    demais sistemas (ex.: macOS) não faz nada.
     
     Args:
-        input_path (str): Caminho do arquivo de entrada
-        output_path (str): Caminho do arquivo de saída
-        quality_preset (str): Preset de qualidade ('Alta', 'Média', 'Baixa')
-        format_type (str): Tipo de formato ('video', 'audio', 'image')
+        pid (int): PID do processo
+        cpu_set (iterable): Índices dos núcleos permitidos
+    """
+    try:
+        if hasattr(os, 'sched_setaffinity'):
+            os.sched_setaffinity(pid, cpu_set)
+        elif sys.platform == 'win32':
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.OpenProcess(_PROCESS_SET_INFORMATION | _PROCESS_QUERY_INFORMATION, False, pid)
+            if handle:
+                try:
+                    kernel32.SetProcessAffinityMask(handle, ctypes.c_size_t(sum(1 << cpu for cpu in cpu_set)))
+                finally:
+                    kernel32.CloseHandle(handle)
+    except Exception:
+        pass
+
+# Resultado da detecção de encoders (None = ainda não detectado)
+_hw_encoders_cache = None
+
+def _detect_hwaccel(ffmpeg_path):
+    """
+    Detecta o melhor encoder de hardware disponível no FFmpeg.
+    
+    A consulta a `ffmpeg -encoders` é feita apenas uma vez por processo
+    e o resultado fica em cache no módulo.
+    
+    Args:
+        ffmpeg_path (str): Caminho do executável do FFmpeg
     
     Returns:
-        tuple: (success: bool, message: str)
+        str: Nome do encoder (ex.: 'h264_nvenc') ou None se não houver
     """
-    # Caminho para o executável do FFmpeg
-    ffmpeg_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'bin', 'ffmpeg.exe')
+    global _hw_encoders_cache
     
-    # Verifica se o FFmpeg existe
-    if not os.path.exists(ffmpeg_path):
-        return False, f"FFmpeg não encontrado em: {ffmpeg_path}"
+    if _hw_encoders_cache is None:
+        _hw_encoders_cache = []
+        try:
+            result = subprocess.run(
+                [ffmpeg_path, '-hide_banner', '-encoders'],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=PIPE_BUFSIZE,
+                text=True,
+                timeout=10,
+                **popen_kwargs()
+            )
+            listed = {parts[1] for parts in map(str.split, result.stdout.splitlines()) if len(parts) > 1}
+            _hw_encoders_cache = [enc for enc in HW_ENCODERS.values() if enc in listed]
+        except Exception:
+            pass
     
-    # Verifica se o arquivo de entrada existe
-    if not os.path.exists(input_path):
-        return False, f"Arquivo de entrada não encontrado: {input_path}"
+    return _hw_encoders_cache[0] if _hw_encoders_cache else None
+
+def _resolve_video_encoder(ffmpeg_path, hwaccel):
+    """Resolve o encoder de vídeo a partir da opção `hwaccel`."""
+    if hwaccel == 'none':
+        return 'libx264'
+    if hwaccel == 'auto':
+        return _detect_hwaccel(ffmpeg_path) or 'libx264'
+    return HW_ENCODERS.get(hwaccel, 'libx264')
+
+def _video_codec_args(encoder, crf_value, threads=None):
+    """
+    Monta os parâmetros de codec de vídeo para o encoder escolhido.
     
-    # Cria o diretório de saída se não existir
-    output_dir = os.path.dirname(output_path)
-    if output_dir and not os.path.exists(output_dir):
-        os.makedirs(output_dir, exist_ok=True)
+    Com um número fixo de threads (vários encodes simultâneos), o libx264
+    usa sliced threads, que dividem cada quadro entre as threads em vez de
+    manter vários quadros em voo, reduzindo a disputa por cache.
+    """
+    if encoder == 'h264_nvenc':
+        return ['-c:v', 'h264_nvenc', '-preset', 'p5', '-rc', 'vbr', '-cq', crf_value]
+    if encoder == 'h264_qsv':
+        return ['-c:v', 'h264_qsv', '-global_quality', crf_value]
+    if encoder == 'h264_amf':
+        return ['-c:v', 'h264_amf', '-rc', 'cqp', '-qp_i', crf_value, '-qp_p', crf_value]
+    if encoder == 'h264_videotoolbox':
+        return ['-c:v', 'h264_videotoolbox', '-q:v', _VIDEOTOOLBOX_QUALITY.get(crf_value, '55')]
+    if threads:
+        return ['-c:v', 'libx264', '-crf', crf_value, '-x264-params', f'threads={threads}:sliced-threads=1']
+    return ['-c:v', 'libx264', '-crf', crf_value]
+
+def muxer_for_extension(extension):
+    """
+    Retorna o nome do muxer do FFmpeg (-f) correspondente a uma extensão.
     
-    # Mapeia presets de qualidade para parâmetros do FFmpeg
-    quality_map = {
-        'Alta': '18',
-        'Média': '23',  # Valor padrão
-        'Baixa': '28'
-    }
-    crf_value = quality_map.get(quality_preset, '23')
+    Args:
+        extension (str): Extensão do arquivo, com ou sem ponto ('mkv', '.mp4')
     
-    # Monta o comando baseado no tipo de formato
-    command = [ffmpeg_path, '-i', input_path]
+    Returns:
+        str: Nome do muxer ('matroska', 'mp4', ...)
+    """
+    extension = extension.lower().lstrip('.')
+    return _EXT_MUXERS.get(extension, extension)
+
+def _output_args(output_arg, quality_preset, format_type, encoder, output_format=None, threads=None,
+                 audio_codec=None, audio_bitrate=None):
+    """
+    Monta os parâmetros de uma saída do FFmpeg (codecs, threads, container e destino).
+    
+    Args:
+        output_arg (str): Caminho de saída ou 'pipe:1'
+        quality_preset (str): Preset de qualidade ('Alta', 'Média', 'Baixa')
+        format_type (str): Tipo de formato ('video', 'audio', 'image')
+        encoder (str): Encoder de vídeo (None fora de 'video')
+        output_format (str): Container da saída (-f)
+        threads (int): Número de threads do FFmpeg (-threads). Para vídeo e
+            áudio o padrão é 0 (automático, todos os núcleos)
+        audio_codec (str): Codec de áudio (padrão: aac no vídeo, libmp3lame no áudio)
+        audio_bitrate (str): Bitrate do áudio (padrão: 128k no vídeo, 192k no áudio)
+    
+    Returns:
+        list: Parâmetros da saída, terminando no destino
+    """
+    crf_value = QUALITY_CRF.get(quality_preset, '23')
+    args = []
     
     if format_type == 'video':
         # Configurações para vídeo
-        command.extend([
-            '-c:v', 'libx264',  # Codec de vídeo
-            '-crf', crf_value,  # Fator de qualidade
-            '-c:a', 'aac',      # Codec de áudio
-            '-b:a', '128k'      # Bitrate do áudio
+        args.extend(_video_codec_args(encoder, crf_value, threads))
+        args.extend([
+            '-c:a', audio_codec or 'aac',      # Codec de áudio
+            '-b:a', audio_bitrate or '128k'    # Bitrate do áudio
         ])
+        if Path(output_arg).suffix.lower() in _FASTSTART_EXTS:
+            args.extend(['-movflags', '+faststart'])
     elif format_type == 'audio':
         # Configurações para áudio
-        command.extend([
-            '-c:a', 'libmp3lame',  # Codec de áudio MP3
-            '-b:a', '192k'         # Bitrate do áudio
+        args.extend([
+            '-c:a', audio_codec or 'libmp3lame',  # Codec de áudio (MP3 por padrão)
+            '-b:a', audio_bitrate or '192k'       # Bitrate do áudio
         ])
     elif format_type == 'image':
         # Configurações para imagem
-        command.extend([
+        args.extend([
             '-q:v', '2'  # Qualidade para imagens
         ])
     
-    # Adiciona opções finais
-    command.extend([
-        '-y',        # Sobrescreve o arquivo de saída se existir
-        output_path  # Arquivo de saída
-    ])
+    if threads is None and format_type in ('video', 'audio'):
+        threads = 0
+    if threads is not None:
+        args.extend(['-threads', str(threads)])
+    
+    if output_format:
+        args.extend(['-f', output_format])
+    args.append(output_arg)
     
+    return args
+
+def _build_command(ffmpeg_path, input_arg, output_arg, quality_preset, format_type, encoder,
+                   input_format=None, output_format=None, threads=None, audio_codec=None, audio_bitrate=None):
+    """
+    Monta a linha de comando do FFmpeg para uma conversão.
+    
+    Args:
+        ffmpeg_path (str): Caminho do executável do FFmpeg
+        input_arg (str): Caminho de entrada ou 'pipe:0'
+        output_arg (str): Caminho de saída ou 'pipe:1'
+        quality_preset (str): Preset de qualidade ('Alta', 'Média', 'Baixa')
+        format_type (str): Tipo de formato ('video', 'audio', 'image')
+        encoder (str): Encoder de vídeo (None fora de 'video')
+        input_format (str): Container da entrada (-f)
+        output_format (str): Container da saída (-f)
+        threads (int): Número de threads do FFmpeg (-threads). Para vídeo e
+            áudio o padrão é 0 (automático, todos os núcleos)
+        audio_codec (str): Codec de áudio (padrão do format_type se omitido)
+        audio_bitrate (str): Bitrate do áudio (padrão do format_type se omitido)
+    
+    Returns:
+        list: Comando pronto para subprocess
+    """
+    # -y: sobrescreve o arquivo de saída se existir
+    command = [ffmpeg_path, '-y']
+    if encoder == 'h264_nvenc':
+        # Mantém a decodificação na GPU junto com o encode
+        command.extend(['-hwaccel', 'cuda', '-hwaccel_output_format', 'cuda'])
+    if input_format:
+        command.extend(['-f', input_format])
+    command.extend(['-i', input_arg])
+    
+    command.extend(_output_args(output_arg, quality_preset, format_type, encoder, output_format, threads,
+                                audio_codec, audio_bitrate))
+    
+    return command
+
+def _is_path(value):
+    """Indica se o valor é um caminho (e não bytes/objeto de arquivo)."""
+    return isinstance(value, (str, os.PathLike))
+
+def _run_piped(command, input_data, output_file, timeout, cpu_set=None, cancel_event=None):
+    """
+    Executa o FFmpeg trafegando entrada e/ou saída por pipes.
+    
+    A entrada é escrita em blocos por uma thread auxiliar enquanto a
+    thread atual lê o stdout, evitando deadlock com buffers cheios.
+    
+    Args:
+        command (list): Comando completo do FFmpeg
+        input_data: bytes ou objeto de arquivo legível (None se a entrada for um caminho)
+        output_file: Objeto de arquivo gravável (None se a saída for um caminho)
+        timeout (int): Tempo máximo em segundos
+        cpu_set (iterable): Núcleos aos quais o processo fica restrito (opcional)
+        cancel_event (threading.Event): Evento que, quando acionado, encerra o FFmpeg
+    
+    Returns:
+        tuple: (returncode: int, stderr: bytes)
+    
+    Raises:
+        subprocess.TimeoutExpired: Se o tempo máximo for excedido
+        ProcessCancelled: Se cancel_event for acionado
+    """
+    process = subprocess.Popen(
+        command,
+        stdin=subprocess.PIPE if input_data is not None else subprocess.DEVNULL,
+        stdout=subprocess.PIPE if output_file is not None else subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        bufsize=PIPE_BUFSIZE,
+        **popen_kwargs()
+    )
+    lower_priority(process.pid)
+    if cpu_set:
+        _pin_process(process.pid, cpu_set)
+    
+    stderr_chunks = []
+    timed_out = threading.Event()
+    cancelled = threading.Event()
+    finished = threading.Event()
+    
+    def feed_input():
+        try:
+            if isinstance(input_data, (bytes, bytearray, memoryview)):
+                view = memoryview(input_data)
+                for offset in range(0, len(view), PIPE_BUFSIZE):
+                    process.stdin.write(view[offset:offset + PIPE_BUFSIZE])
+            else:
+                while True:
+                    chunk = input_data.read(PIPE_BUFSIZE)
+                    if not chunk:
+                        break
+                    process.stdin.write(chunk)
+        except OSError:
+            # O FFmpeg pode fechar o stdin antes de consumir tudo (ex.: erro)
+            pass
+        finally:
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+    
+    def drain_stderr():
+        stderr_chunks.append(process.stderr.read())
+    
+    def watch():
+        # Encerra o processo no timeout ou no cancelamento; a thread atual fica presa na leitura
+        deadline = time.monotonic() + timeout
+        while not finished.wait(CANCEL_POLL_INTERVAL):
+            if cancel_event is not None and cancel_event.is_set():
+                cancelled.set()
+            elif time.monotonic() >= deadline:
+                timed_out.set()
+            else:
+                continue
+            process.kill()
+            return
+    
+    threads = [threading.Thread(target=drain_stderr, daemon=True)]
+    if input_data is not None:
+        threads.append(threading.Thread(target=feed_input, daemon=True))
+    for thread in threads:
+        thread.start()
+    
+    watcher = threading.Thread(target=watch, daemon=True)
+    watcher.start()
     try:
-        # Executa o comando e aguarda a conclusão
-        result = subprocess.run(
-            command, 
-            check=True, 
-            capture_output=True, 
-            text=True,
-            timeout=300  # Timeout de 5 minutos
+        if output_file is not None:
+            while True:
+                chunk = process.stdout.read(PIPE_BUFSIZE)
+                if not chunk:
+                    break
+                output_file.write(chunk)
+        process.wait()
+        for thread in threads:
+            thread.join()
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        finished.set()
+        watcher.join()
+    
+    if cancelled.is_set():
+        raise ProcessCancelled()
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(command, timeout)
+    
+    return process.returncode, b''.join(stderr_chunks)
+
+def _run_to_files(command, timeout, cpu_set=None, cancel_event=None):
+    """
+    Executa um comando do FFmpeg que lê e grava apenas arquivos.
+    
+    O log do FFmpeg (stderr) vai para um arquivo temporário e só é lido
+    em caso de falha.
+    
+    Raises:
+        subprocess.CalledProcessError: Se o FFmpeg terminar com erro
+        subprocess.TimeoutExpired: Se o tempo máximo for excedido
+        ProcessCancelled: Se cancel_event for acionado (o FFmpeg é encerrado)
+    """
+    with tempfile.TemporaryFile() as stderr_file:
+        process = subprocess.Popen(
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=stderr_file,
+            bufsize=PIPE_BUFSIZE,
+            **popen_kwargs()
         )
+        lower_priority(process.pid)
+        if cpu_set:
+            _pin_process(process.pid, cpu_set)
+        
+        communicate(process, timeout, cancel_event)
+        returncode = process.returncode
+        
+        if returncode != 0:
+            stderr_file.seek(0)
+            raise subprocess.CalledProcessError(
+                returncode, command, stderr=stderr_file.read().decode('utf-8', errors='replace')
+            )
+
+def run_ffmpeg_conversion(input_path, output_path, quality_preset='medium', format_type='video', hwaccel='auto',
+                          input_format=None, output_format=None, threads=None, cpu_set=None, cancel_event=None,
+                          audio_codec=None, audio_bitrate=None):
+    """
+    Executa a conversão usando FFmpeg.
+    
+    Entrada e saída podem ser caminhos ou dados em memória. Quando não são
+    caminhos, o FFmpeg lê de `pipe:0` e/ou escreve em `pipe:1`, sem passar
+    pelo disco.
+    
+    Args:
+        input_path (str | bytes | IO): Caminho do arquivo de entrada, bytes
+            ou objeto de arquivo legível
+        output_path (str | IO): Caminho do arquivo de saída ou objeto de
+            arquivo gravável
+        quality_preset (str): Preset de qualidade ('Alta', 'Média', 'Baixa')
+        format_type (str): Tipo de formato ('video', 'audio', 'image')
+        hwaccel (str): Aceleração de hardware para vídeo ('auto', 'none',
+            'nvenc', 'qsv', 'amf', 'videotoolbox'). Em 'auto' o encoder de
+            hardware é usado quando disponível, com fallback para libx264.
+        input_format (str): Container da entrada (-f), opcional em modo pipe
+        output_format (str): Container da saída (-f), obrigatório quando a
+            saída é um objeto de arquivo
+        threads (int): Número de threads do FFmpeg; útil para limitar cada
+            processo ao rodar várias conversões em paralelo (padrão: automático)
+        cpu_set (iterable): Núcleos aos quais o processo fica restrito; use
+            conjuntos disjuntos em conversões simultâneas (padrão: todos)
+        cancel_event (threading.Event): Evento que, quando acionado, encerra o
+            processo FFmpeg em andamento
+        audio_codec (str): Codec de áudio; omitido, usa o padrão do format_type
+        audio_bitrate (str): Bitrate do áudio; omitido, usa o padrão do format_type
+    
+    Returns:
+        tuple: (success: bool, message: str)
+    """
+    # Caminho para o executável do FFmpeg
+    ffmpeg_path = _FFMPEG_PATH
+    
+    # Verifica se o FFmpeg existe
+    if not os.path.exists(ffmpeg_path):
+        return False, f"FFmpeg não encontrado em: {ffmpeg_path}"
+    
+    input_is_path = _is_path(input_path)
+    output_is_path = _is_path(output_path)
+    
+    # Verifica se o arquivo de entrada existe
+    if input_is_path and not os.path.exists(input_path):
+        return False, f"Arquivo de entrada não encontrado: {input_path}"
+    
+    if not output_is_path and not output_format:
+        return False, "output_format é obrigatório quando a saída é um pipe"
+    
+    # Cria o diretório de saída se não existir
+    if output_is_path:
+        output_dir = os.path.dirname(output_path)
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir, exist_ok=True)
+    
+    encoder = _resolve_video_encoder(ffmpeg_path, hwaccel) if format_type == 'video' else None
+    
+    command = _build_command(
+        ffmpeg_path,
+        input_path if input_is_path else 'pipe:0',
+        output_path if output_is_path else 'pipe:1',
+        quality_preset,
+        format_type,
+        encoder,
+        input_format=input_format,
+        output_format=output_format,
+        threads=threads,
+        audio_codec=audio_codec,
+        audio_bitrate=audio_bitrate
+    )
+    
+    try:
+        if input_is_path and output_is_path:
+            _run_to_files(command, timeout=300, cpu_set=cpu_set, cancel_event=cancel_event)  # Timeout de 5 minutos
+        else:
+            returncode, stderr = _run_piped(
+                command,
+                None if input_is_path else input_path,
+                None if output_is_path else output_path,
+                timeout=300,
+                cpu_set=cpu_set,
+                cancel_event=cancel_event
+            )
+            if returncode != 0:
+                raise subprocess.CalledProcessError(
+                    returncode, command, stderr=stderr.decode('utf-8', errors='replace')
+                )
+            return True, "Conversão concluída com sucesso!"
         
         # Verifica se o arquivo de saída foi criado
         if os.path.exists(output_path):
@@ -85,18 +514,224 @@ def run_ffmpeg_conversion(input_path, output_path, quality_preset='medium', form
             return False, "Arquivo de saída não foi criado"
             
     except subprocess.CalledProcessError as e:
+        # Encoder de hardware listado mas sem dispositivo utilizável: refaz em software
+        # (não é possível refazer com streams já consumidos ou saída parcialmente escrita)
+        retryable = output_is_path and (input_is_path or isinstance(input_path, (bytes, bytearray, memoryview)))
+        if encoder not in (None, 'libx264') and hwaccel == 'auto' and retryable:
+            return run_ffmpeg_conversion(input_path, output_path, quality_preset, format_type, hwaccel='none',
+                                         input_format=input_format, output_format=output_format, threads=threads,
+                                         cpu_set=cpu_set, cancel_event=cancel_event,
+                                         audio_codec=audio_codec, audio_bitrate=audio_bitrate)
         error_msg = f"Erro ao converter com FFmpeg: {e.stderr if e.stderr else str(e)}"
         return False, error_msg
         
     except subprocess.TimeoutExpired:
         return False, "Conversão cancelada por timeout (5 minutos)"
         
+    except ProcessCancelled:
+        return False, CANCELLED_MESSAGE
+        
+    except FileNotFoundError:
+        return False, f"Executável do FFmpeg não encontrado: {ffmpeg_path}"
+        
+    except Exception as e:
+        return False, f"Erro inesperado: {str(e)}"
+
+def run_ffmpeg_multi_output(input_path, outputs, hwaccel='auto', threads=None):
+    """
+    Converte um mesmo arquivo para várias saídas com um único processo FFmpeg.
+    
+    A entrada é lida e decodificada uma só vez e os quadros são entregues a
+    um encoder por saída. Só compensa quando todas as saídas partem da mesma
+    fonte (ex.: mp4 + webm + mp3 de um mesmo vídeo); para arquivos
+    diferentes use run_ffmpeg_batch.
+    
+    Args:
+        input_path (str): Caminho do arquivo de entrada
+        outputs (list): Tuplas (output_path, format_type, quality_preset)
+        hwaccel (str): Aceleração de hardware para as saídas de vídeo
+            (mesmas opções de run_ffmpeg_conversion)
+        threads (int): Número de threads de cada encoder (padrão: automático)
+    
+    Returns:
+        tuple: (success: bool, message: str)
+    """
+    ffmpeg_path = _FFMPEG_PATH
+    
+    if not os.path.exists(ffmpeg_path):
+        return False, f"FFmpeg não encontrado em: {ffmpeg_path}"
+    
+    if not os.path.exists(input_path):
+        return False, f"Arquivo de entrada não encontrado: {input_path}"
+    
+    if not outputs:
+        return False, "Nenhuma saída informada"
+    
+    for output_path, _, _ in outputs:
+        output_dir = os.path.dirname(output_path)
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir, exist_ok=True)
+    
+    has_video = any(format_type == 'video' for _, format_type, _ in outputs)
+    encoder = _resolve_video_encoder(ffmpeg_path, hwaccel) if has_video else None
+    
+    # Sem -hwaccel_output_format: os quadros decodificados precisam servir
+    # também às saídas de áudio/imagem, que não leem memória da GPU
+    command = [ffmpeg_path, '-y', '-i', input_path]
+    for output_path, format_type, quality_preset in outputs:
+        command.extend(_output_args(
+            output_path,
+            quality_preset,
+            format_type,
+            encoder if format_type == 'video' else None,
+            threads=threads
+        ))
+    
+    try:
+        _run_to_files(command, timeout=300 * len(outputs))
+        
+        missing = [output_path for output_path, _, _ in outputs if not os.path.exists(output_path)]
+        if missing:
+            return False, f"Arquivos de saída não foram criados: {', '.join(missing)}"
+        return True, f"Conversão concluída com sucesso! ({len(outputs)} saídas)"
+        
+    except subprocess.CalledProcessError as e:
+        # Encoder de hardware listado mas sem dispositivo utilizável: refaz em software
+        if encoder not in (None, 'libx264') and hwaccel == 'auto':
+            return run_ffmpeg_multi_output(input_path, outputs, hwaccel='none', threads=threads)
+        return False, f"Erro ao converter com FFmpeg: {e.stderr if e.stderr else str(e)}"
+        
+    except subprocess.TimeoutExpired:
+        return False, "Conversão cancelada por timeout"
+        
     except FileNotFoundError:
         return False, f"Executável do FFmpeg não encontrado: {ffmpeg_path}"
         
     except Exception as e:
         return False, f"Erro inesperado: {str(e)}"
 
+async def _run_batch_job(commands, cpu_slots):
+    """
+    Executa um job do lote, tentando cada comando alternativo em ordem.
+    
+    Args:
+        commands (list): Comandos do FFmpeg (o primeiro que funcionar vence)
+        cpu_slots (asyncio.Queue): Conjuntos de núcleos livres; limita os
+            processos simultâneos e mantém cada um em núcleos exclusivos
+    
+    Returns:
+        tuple: (success: bool, message: str)
+    """
+    cpu_set = await cpu_slots.get()
+    try:
+        message = "Nenhum comando para executar"
+        for command in commands:
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *command,
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.PIPE,
+                    **popen_kwargs()
+                )
+            except FileNotFoundError:
+                return False, f"Executável do FFmpeg não encontrado: {command[0]}"
+            
+            lower_priority(process.pid)
+            _pin_process(process.pid, cpu_set)
+            
+            try:
+                _, stderr = await asyncio.wait_for(process.communicate(), timeout=300)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                return False, "Conversão cancelada por timeout (5 minutos)"
+            
+            if process.returncode == 0:
+                if os.path.exists(command[-1]):
+                    return True, "Conversão concluída com sucesso!"
+                return False, "Arquivo de saída não foi criado"
+            
+            message = f"Erro ao converter com FFmpeg: {stderr.decode('utf-8', errors='replace')}"
+        
+        return False, message
+    finally:
+        cpu_slots.put_nowait(cpu_set)
+
+def run_ffmpeg_batch(jobs, max_procs=None):
+    """
+    Executa várias conversões FFmpeg em paralelo.
+    
+    Os processos são disparados com asyncio, no máximo `max_procs` por vez.
+    Como o FFmpeg já é multithread, cada processo recebe
+    `-threads cpu_count // max_procs` e fica restrito a um bloco exclusivo
+    de núcleos, evitando que encodes simultâneos disputem os mesmos núcleos.
+    
+    Args:
+        jobs (list): Lista de dicts com 'input_path' e 'output_path' e,
+            opcionalmente, 'quality_preset', 'format_type' e 'hwaccel'
+        max_procs (int): Processos FFmpeg simultâneos (padrão: metade dos núcleos;
+            valores menores que 1 contam como 1)
+    
+    Returns:
+        list: Tuplas (success: bool, message: str) na mesma ordem de `jobs`
+    """
+    ffmpeg_path = _FFMPEG_PATH
+    
+    if not os.path.exists(ffmpeg_path):
+        return [(False, f"FFmpeg não encontrado em: {ffmpeg_path}")] * len(jobs)
+    
+    cpus = _available_cpus()
+    cpu_count = len(cpus)
+    if not max_procs:
+        max_procs = cpu_count // 2
+    # Valores zerados ou negativos viram 1 (evita divisão por zero abaixo)
+    max_procs = max(1, max_procs)
+    threads = max(1, cpu_count // max_procs)
+    
+    # Blocos disjuntos de núcleos, um por processo simultâneo
+    cpu_sets = [cpus[(slot * threads) % cpu_count:][:threads] for slot in range(max_procs)]
+    
+    prepared = []
+    for job in jobs:
+        input_path = job['input_path']
+        output_path = job['output_path']
+        quality_preset = job.get('quality_preset', 'medium')
+        format_type = job.get('format_type', 'video')
+        hwaccel = job.get('hwaccel', 'auto')
+        
+        if not os.path.exists(input_path):
+            prepared.append((False, f"Arquivo de entrada não encontrado: {input_path}"))
+            continue
+        
+        output_dir = os.path.dirname(output_path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        
+        encoder = _resolve_video_encoder(ffmpeg_path, hwaccel) if format_type == 'video' else None
+        commands = [_build_command(ffmpeg_path, input_path, output_path, quality_preset, format_type,
+                                   encoder, threads=threads)]
+        
+        # Fallback em software para encoders de hardware sem dispositivo utilizável
+        if encoder not in (None, 'libx264') and hwaccel == 'auto':
+            commands.append(_build_command(ffmpeg_path, input_path, output_path, quality_preset, format_type,
+                                           'libx264', threads=threads))
+        
+        prepared.append(commands)
+    
+    async def run_all():
+        cpu_slots = asyncio.Queue()
+        for cpu_set in cpu_sets:
+            cpu_slots.put_nowait(cpu_set)
+        
+        async def run_or_passthrough(item):
+            if isinstance(item, tuple):
+                return item
+            return await _run_batch_job(item, cpu_slots)
+        
+        return await asyncio.gather(*(run_or_passthrough(item) for item in prepared))
+    
+    return list(asyncio.run(run_all()))
+
 def get_file_info(file_path):
     """
     Obtém informações sobre um arquivo de mídia usando FFprobe.
@@ -107,7 +742,7 @@ def get_file_info(file_path):
     Returns:
         dict: Informações do arquivo ou None se houver erro
     """
-    ffprobe_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'bin', 'ffprobe.exe')
+    ffprobe_path = _FFPROBE_PATH
     
     if not os.path.exists(ffprobe_path):
         return None
@@ -122,70 +757,112 @@ def get_file_info(file_path):
     ]
     
     try:
-        result = subprocess.run(command, capture_output=True, text=True, check=True)
-        import json
-        return json.loads(result.stdout)
+        result = subprocess.run(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=PIPE_BUFSIZE,
+            check=True,
+            **popen_kwargs()
+        )
+        # json/orjson aceitam bytes diretamente, sem decodificar para str antes
+        return _json_loads(result.stdout)
     except:
         return None
 
-def detect_format_type(file_path):
+def _probe_has_stream(file_path, kind):
     """
-    Detecta o tipo de formato do arquivo (video, audio, image).
+    Verifica com o ffprobe se o arquivo possui um stream do tipo informado.
+    
+    Consulta apenas o campo codec_type do primeiro stream em CSV, sem
+    gerar nem desserializar o JSON completo do arquivo.
     
     Args:
         file_path (str): Caminho do arquivo
+        kind (str): Tipo do stream ('video' ou 'audio')
     
     Returns:
-        str: Tipo do formato ('video', 'audio', 'image', 'unknown')
+        bool: True/False, ou None se o ffprobe não puder ser executado
     """
-    file_info = get_file_info(file_path)
+    if not os.path.exists(_FFPROBE_PATH):
+        return None
     
-    if not file_info or 'streams' not in file_info:
-        # Fallback baseado na extensão
-        ext = Path(file_path).suffix.lower()
-        video_exts = ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm']
-        audio_exts = ['.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a']
-        image_exts = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp']
-        
-        if ext in video_exts:
-            return 'video'
-        elif ext in audio_exts:
-            return 'audio'
-        elif ext in image_exts:
-            return 'image'
-        else:
-            return 'unknown'
+    command = [
+        _FFPROBE_PATH,
+        '-v', 'error',
+        '-select_streams', f'{kind[0]}:0',
+        '-show_entries', 'stream=codec_type',
+        '-of', 'csv=p=0',
+        file_path
+    ]
     
-    # Analisa os streams
-    has_video = False
-    has_audio = False
+    try:
+        result = subprocess.run(command, capture_output=True, **popen_kwargs())
+    except Exception:
+        return None
     
-    for stream in file_info['streams']:
-        codec_type = stream.get('codec_type', '')
-        if codec_type == 'video':
-            has_video = True
-        elif codec_type == 'audio':
-            has_audio = True
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() == kind.encode('ascii')
+
+def _detect_by_extension(file_path):
+    """Detecta o tipo de formato apenas pela extensão do arquivo."""
+    ext = Path(file_path).suffix.lower()
     
-    if has_video:
+    if ext in _VIDEO_EXTS:
         return 'video'
-    elif has_audio:
+    elif ext in _AUDIO_EXTS:
         return 'audio'
-    else:
+    elif ext in _IMAGE_EXTS:
         return 'image'
+    else:
+        return 'unknown'
 
-def is_ffmpeg_available() -> bool:
-    """Verifica se o FFmpeg está disponível no sistema."""
-    # Caminho para o executável do FFmpeg
-    ffmpeg_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'bin', 'ffmpeg.exe')
+def detect_format_type(file_path):
+    """
+    Detecta o tipo de formato do arquivo (video, audio, image).
+    
+    Extensões conhecidas e não ambíguas são resolvidas sem executar o
+    ffprobe; os demais arquivos são inspecionados pelo conteúdo.
     
+    Args:
+        file_path (str): Caminho do arquivo
+    
+    Returns:
+        str: Tipo do formato ('video', 'audio', 'image', 'unknown')
+    """
+    if Path(file_path).suffix.lower() not in _AMBIGUOUS_EXTS:
+        format_type = _detect_by_extension(file_path)
+        if format_type != 'unknown':
+            return format_type
+    
+    has_video = _probe_has_stream(file_path, 'video')
+    if has_video:
+        return 'video'
+    
+    # Se o ffprobe não pôde ser executado, não adianta consultar o áudio
+    if has_video is not None:
+        has_audio = _probe_has_stream(file_path, 'audio')
+        if has_audio:
+            return 'audio'
+        if has_audio is not None:
+            # Arquivo lido pelo ffprobe sem streams de vídeo nem de áudio
+            return 'image'
+    
+    # Fallback baseado na extensão
+    return _detect_by_extension(file_path)
+
+@functools.lru_cache(maxsize=1)
+def is_ffmpeg_available() -> bool:
+    """Verifica se o FFmpeg está disponível no sistema (resultado em cache)."""
     # Verifica se o FFmpeg existe no diretório bin
-    if os.path.exists(ffmpeg_path):
+    if os.path.exists(_FFMPEG_PATH):
         return True
     
     # Verifica se o FFmpeg está no PATH do sistema
     try:
-        subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True)
+        subprocess.run(['ffmpeg', '-version'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True,
+                       **popen_kwargs())
         return True
     except (subprocess.CalledProcessError, FileNotFoundError):
         return False
\ No newline at end of file
@@ -11,12 +11,40 @@ Versão: 1.0.0
 """
 
 import os
+import functools
+import json
+import logging
+import socket
 import subprocess
 import shutil
 import tempfile
+import threading
+import time
+from multiprocessing import util as mp_util
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import Optional, Callable
 from pathlib import Path
 
+from .process_utils import popen_kwargs, lower_priority, communicate, ProcessCancelled, CANCELLED_MESSAGE
+
+logger = logging.getLogger(__name__)
+
+# Import condicional da ponte UNO (distribuída junto com o LibreOffice)
+try:
+    import uno
+    from com.sun.star.beans import PropertyValue
+    UNO_AVAILABLE = True
+except ImportError:
+    UNO_AVAILABLE = False
+
+# Filtro de exportação PDF conforme o tipo do documento carregado via UNO
+# (writer_pdf_Export é o padrão para os demais tipos)
+PDF_EXPORT_FILTERS = (
+    ('com.sun.star.sheet.SpreadsheetDocument', 'calc_pdf_Export'),
+    ('com.sun.star.presentation.PresentationDocument', 'impress_pdf_Export'),
+    ('com.sun.star.drawing.DrawingDocument', 'draw_pdf_Export'),
+)
+
 
 class LibreOfficeEngine:
     """Engine para conversões usando LibreOffice CLI."""
@@ -35,6 +63,16 @@ class LibreOfficeEngine:
         
         self.executable_path = self._find_libreoffice()
         
+        # Perfil de usuário próprio (-env:UserInstallation) para execuções paralelas
+        self.user_installation: Optional[str] = None
+        
+        # Processo soffice persistente (iniciado sob demanda quando UNO está disponível)
+        self._daemon = None
+        self._daemon_profile_dir = None
+        self._desktop = None
+        # Falha ao iniciar o daemon: as próximas conversões vão direto para a linha de comando
+        self._daemon_failed = False
+        
         # Mapeamento de formatos suportados
         self.format_mapping = {
             # Documentos de texto
@@ -58,6 +96,13 @@ class LibreOfficeEngine:
             'odp': 'odp:impress8'
         }
         
+        # Argumentos fixos da linha de comando por formato, montados uma única vez
+        # (o executável fica de fora, pois executable_path pode ser trocado depois)
+        self._cmd_templates = {
+            fmt: ('--headless', '--convert-to', output_filter, '--outdir')
+            for fmt, output_filter in self.format_mapping.items()
+        }
+        
         # Configurações de qualidade para PDF
         self.pdf_quality_settings = {
             'baixa': {
@@ -92,12 +137,25 @@ class LibreOfficeEngine:
     
     def _find_libreoffice(self) -> Optional[str]:
         """Encontra o executável do LibreOffice no sistema."""
-        for path in self.libreoffice_paths:
+        return self._locate_executable(tuple(self.libreoffice_paths))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _locate_executable(candidates: tuple) -> Optional[str]:
+        """Procura o primeiro candidato existente (resultado em cache por processo).
+        
+        Caminhos absolutos são verificados diretamente; apenas nomes e caminhos
+        relativos passam pela busca do shutil.which.
+        """
+        for path in candidates:
             try:
-                if os.path.isfile(path):
-                    return path
-                elif shutil.which(path):
-                    return shutil.which(path)
+                if os.path.isabs(path):
+                    if os.path.isfile(path):
+                        return path
+                else:
+                    found = shutil.which(path)
+                    if found:
+                        return found
             except Exception:
                 continue
         return None
@@ -106,6 +164,183 @@ class LibreOfficeEngine:
         """Verifica se o LibreOffice está disponível."""
         return self.executable_path is not None
     
+    def _ensure_daemon(self) -> bool:
+        """Garante um soffice persistente escutando via UNO.
+        
+        O processo é iniciado uma única vez, com perfil de usuário próprio,
+        evitando o custo de inicialização do LibreOffice a cada documento.
+        
+        Se o daemon não conseguir iniciar, a falha é lembrada e não há nova
+        tentativa nesta instância.
+        
+        Returns:
+            True se o daemon está pronto para receber conversões
+        """
+        if not (UNO_AVAILABLE and self.is_available()) or self._daemon_failed:
+            return False
+        
+        if self._desktop is not None and self._daemon and self._daemon.poll() is None:
+            return True
+        
+        self.close()
+        
+        try:
+            # Porta livre escolhida pelo sistema para não colidir com outras instâncias
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                sock.bind(('127.0.0.1', 0))
+                port = sock.getsockname()[1]
+            
+            self._daemon_profile_dir = tempfile.mkdtemp(prefix='multiconvert_lo_')
+            self._daemon = subprocess.Popen(
+                [
+                    self.executable_path,
+                    '--headless',
+                    '--invisible',
+                    '--nologo',
+                    '--nodefault',
+                    '--norestore',
+                    '--nofirststartwizard',
+                    f'-env:UserInstallation={Path(self._daemon_profile_dir).as_uri()}',
+                    f'--accept=socket,host=127.0.0.1,port={port};urp;StarOffice.ServiceManager'
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                **popen_kwargs()
+            )
+            lower_priority(self._daemon.pid)
+            
+            local_context = uno.getComponentContext()
+            resolver = local_context.ServiceManager.createInstanceWithContext(
+                'com.sun.star.bridge.UnoUrlResolver', local_context
+            )
+            
+            # Aguardar o listener aceitar conexões (até ~20 segundos)
+            for _ in range(80):
+                if self._daemon.poll() is not None:
+                    break
+                try:
+                    context = resolver.resolve(
+                        f'uno:socket,host=127.0.0.1,port={port};urp;StarOffice.ComponentContext'
+                    )
+                    self._desktop = context.ServiceManager.createInstanceWithContext(
+                        'com.sun.star.frame.Desktop', context
+                    )
+                    return True
+                except Exception:
+                    time.sleep(0.25)
+        except Exception:
+            pass
+        
+        logger.warning("Não foi possível iniciar o LibreOffice via UNO; usando a linha de comando")
+        self._daemon_failed = True
+        self.close()
+        return False
+    
+    def close(self):
+        """Encerra o soffice persistente e remove seu perfil temporário.
+        
+        Pode ser chamado várias vezes; cada recurso é liberado uma única vez.
+        """
+        desktop, self._desktop = self._desktop, None
+        daemon, self._daemon = self._daemon, None
+        profile_dir, self._daemon_profile_dir = self._daemon_profile_dir, None
+        
+        if desktop is not None:
+            try:
+                desktop.terminate()
+            except Exception:
+                pass
+        
+        if daemon is not None:
+            try:
+                daemon.wait(timeout=5)
+            except Exception:
+                daemon.kill()
+                daemon.wait()
+        
+        if profile_dir:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+    
+    @staticmethod
+    def _pdf_export_filter(document) -> str:
+        """Retorna o filtro de exportação PDF adequado ao tipo do documento UNO."""
+        for service, filter_name in PDF_EXPORT_FILTERS:
+            if document.supportsService(service):
+                return filter_name
+        return 'writer_pdf_Export'
+    
+    @staticmethod
+    def _uno_property(name: str, value) -> 'PropertyValue':
+        """Cria um PropertyValue UNO."""
+        prop = PropertyValue()
+        prop.Name = name
+        prop.Value = value
+        return prop
+    
+    def _convert_via_uno(
+        self,
+        input_path: str,
+        output_path: str,
+        target_format: str,
+        quality: str,
+        progress_callback: Optional[Callable] = None
+    ) -> tuple[bool, str]:
+        """Converte usando o soffice persistente (loadComponentFromURL/storeToURL)."""
+        try:
+            if progress_callback:
+                progress_callback(30, "Convertendo com LibreOffice (UNO)...")
+            
+            document = self._desktop.loadComponentFromURL(
+                Path(input_path).resolve().as_uri(),
+                '_blank',
+                0,
+                (self._uno_property('Hidden', True),)
+            )
+            if document is None:
+                return False, "LibreOffice não conseguiu abrir o documento"
+            
+            try:
+                if target_format == 'pdf':
+                    filter_name = self._pdf_export_filter(document)
+                else:
+                    filter_name = self.format_mapping[target_format].split(':', 1)[1]
+                store_props = [self._uno_property('FilterName', filter_name)]
+                
+                if target_format == 'pdf':
+                    pdf_settings = self.pdf_quality_settings.get(quality, self.pdf_quality_settings['media'])
+                    filter_data = tuple(
+                        self._uno_property(key, value == 'true' if value in ('true', 'false') else int(value))
+                        for key, value in pdf_settings.items()
+                    )
+                    store_props.append(self._uno_property(
+                        'FilterData', uno.Any('[]com.sun.star.beans.PropertyValue', filter_data)
+                    ))
+                
+                output_dir = os.path.dirname(output_path)
+                if output_dir:
+                    os.makedirs(output_dir, exist_ok=True)
+                
+                uno.invoke(document, 'storeToURL', (Path(output_path).resolve().as_uri(), tuple(store_props)))
+            finally:
+                document.close(True)
+            
+            if not os.path.exists(output_path):
+                return False, "Arquivo de saída não foi criado pelo LibreOffice"
+            
+            if progress_callback:
+                progress_callback(100, "Conversão concluída!")
+            
+            return True, f"Documento convertido com sucesso para {target_format.upper()}"
+            
+        except Exception as e:
+            return False, f"Erro na conversão via UNO: {str(e)}"
+    
     def get_version(self) -> str:
         """Obtém a versão do LibreOffice instalado."""
         if not self.is_available():
@@ -115,10 +350,12 @@ class LibreOfficeEngine:
             result = subprocess.run(
                 [self.executable_path, '--version'],
                 capture_output=True,
-                text=True,
-                timeout=10
+                timeout=10,
+                **popen_kwargs()
             )
-            return result.stdout.strip() if result.returncode == 0 else "Versão desconhecida"
+            if result.returncode != 0:
+                return "Versão desconhecida"
+            return result.stdout.decode('utf-8', errors='replace').strip()
         except Exception as e:
             return f"Erro ao obter versão: {str(e)}"
     
@@ -128,7 +365,9 @@ class LibreOfficeEngine:
         output_path: str,
         target_format: str,
         quality: str = 'media',
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        temp_dir: Optional[str] = None,
+        cancel_event: Optional[threading.Event] = None
     ) -> tuple[bool, str]:
         """Converte um documento usando LibreOffice.
         
@@ -138,128 +377,193 @@ class LibreOfficeEngine:
             target_format: Formato de saída
             quality: Preset de qualidade
             progress_callback: Callback para progresso
+            temp_dir: Diretório temporário já existente a ser reutilizado
+                (esvaziado ao final); se omitido, um novo é criado
+            cancel_event: Evento que, quando acionado, encerra o soffice da
+                linha de comando (a chamada UNO em andamento não é interrompida)
             
         Returns:
             Tupla (sucesso, mensagem)
         """
-        print(f"DEBUG LibreOffice: Verificando disponibilidade. executable_path: {self.executable_path}")
+        logger.debug("Verificando disponibilidade. executable_path: %s", self.executable_path)
         if not self.is_available():
-            print("DEBUG LibreOffice: LibreOffice não está disponível")
+            logger.debug("LibreOffice não está disponível")
             return False, "LibreOffice não está instalado ou não foi encontrado"
         
         try:
-            print(f"DEBUG LibreOffice: Iniciando conversão {input_path} -> {target_format}")
+            logger.debug("Iniciando conversão %s -> %s", input_path, target_format)
             if progress_callback:
                 progress_callback(10, "Preparando conversão com LibreOffice...")
             
             # Validar formato de saída
             if target_format not in self.format_mapping:
-                print(f"DEBUG LibreOffice: Formato {target_format} não suportado")
+                logger.debug("Formato %s não suportado", target_format)
                 return False, f"Formato {target_format} não suportado pelo LibreOffice"
             
-            print(f"DEBUG LibreOffice: Formato mapeado: {self.format_mapping[target_format]}")
+            logger.debug("Formato mapeado: %s", self.format_mapping[target_format])
             
-            # Criar diretório temporário para a conversão
-            with tempfile.TemporaryDirectory() as temp_dir:
-                print(f"DEBUG LibreOffice: Diretório temporário: {temp_dir}")
-                if progress_callback:
-                    progress_callback(20, "Configurando parâmetros de conversão...")
-                
-                # Preparar comando base
-                cmd = [
-                    self.executable_path,
-                    '--headless',
-                    '--convert-to',
-                    self.format_mapping[target_format],
-                    '--outdir',
-                    temp_dir,
-                    input_path
-                ]
-                
-                # Adicionar configurações específicas para PDF
-                if target_format == 'pdf':
-                    cmd = self._add_pdf_options(cmd, quality, temp_dir)
-                
-                print(f"DEBUG LibreOffice: Comando: {' '.join(cmd)}")
-                
-                if progress_callback:
-                    progress_callback(30, "Executando LibreOffice...")
-                
-                # Executar conversão
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=300,  # 5 minutos timeout
-                    cwd=temp_dir
+            # Usar o soffice persistente quando disponível; a linha de comando fica como fallback
+            if self._ensure_daemon():
+                success, message = self._convert_via_uno(input_path, output_path, target_format, quality, progress_callback)
+                if success:
+                    return success, message
+                logger.debug("Falha via UNO, usando linha de comando: %s", message)
+            
+            if cancel_event is not None and cancel_event.is_set():
+                return False, CANCELLED_MESSAGE
+            
+            # Criar diretório de saída se necessário
+            output_dir = os.path.dirname(os.path.abspath(output_path))
+            os.makedirs(output_dir, exist_ok=True)
+            
+            # Diretório temporário reaproveitado (lote) ou criado ao lado da saída
+            # (mesmo sistema de arquivos), para que a movimentação final seja apenas um rename
+            if temp_dir is None:
+                with tempfile.TemporaryDirectory(prefix='.multiconvert_', dir=output_dir) as work_dir:
+                    return self._convert_via_cli(
+                        input_path, output_path, output_dir, target_format, quality, work_dir,
+                        progress_callback, cancel_event
+                    )
+            
+            try:
+                return self._convert_via_cli(
+                    input_path, output_path, output_dir, target_format, quality, temp_dir,
+                    progress_callback, cancel_event
                 )
-                
-                print(f"DEBUG LibreOffice: Return code: {result.returncode}")
-                print(f"DEBUG LibreOffice: STDOUT: {result.stdout}")
-                print(f"DEBUG LibreOffice: STDERR: {result.stderr}")
-                
-                if progress_callback:
-                    progress_callback(80, "Processando resultado...")
-                
-                if result.returncode != 0:
-                    error_msg = result.stderr or result.stdout or "Erro desconhecido do LibreOffice"
-                    print(f"DEBUG LibreOffice: Falha na conversão: {error_msg}")
-                    return False, f"LibreOffice falhou: {error_msg}"
-                
-                # Encontrar arquivo de saída no diretório temporário
-                input_name = Path(input_path).stem
-                temp_output = None
-                
-                for file in os.listdir(temp_dir):
-                    if file.startswith(input_name) and file.endswith(f'.{target_format}'):
-                        temp_output = os.path.join(temp_dir, file)
-                        break
-                
-                if not temp_output or not os.path.exists(temp_output):
-                    return False, "Arquivo de saída não foi criado pelo LibreOffice"
-                
-                # Criar diretório de saída se necessário
-                os.makedirs(os.path.dirname(output_path), exist_ok=True)
-                
-                # Mover arquivo para destino final
-                shutil.move(temp_output, output_path)
-                
-                if progress_callback:
-                    progress_callback(100, "Conversão concluída!")
-                
-                return True, f"Documento convertido com sucesso para {target_format.upper()}"
+            finally:
+                self._clear_directory(temp_dir)
                 
         except subprocess.TimeoutExpired:
             return False, "Timeout: LibreOffice demorou muito para responder"
+        except ProcessCancelled:
+            return False, CANCELLED_MESSAGE
         except Exception as e:
             return False, f"Erro na conversão com LibreOffice: {str(e)}"
     
-    def _add_pdf_options(self, cmd: list, quality: str, temp_dir: str) -> list:
-        """Adiciona opções específicas para conversão PDF."""
-        try:
-            # Criar arquivo de configuração PDF
-            pdf_settings = self.pdf_quality_settings.get(quality, self.pdf_quality_settings['media'])
-            
-            config_content = []
-            for key, value in pdf_settings.items():
-                config_content.append(f"{key}={value}")
-            
-            config_file = os.path.join(temp_dir, 'pdf_export.txt')
-            with open(config_file, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(config_content))
-            
-            # Adicionar parâmetros PDF ao comando
-            pdf_cmd = cmd.copy()
-            pdf_cmd.extend([
-                '--infilter=writer_pdf_Export',
-                f'--outfilter={config_file}'
-            ])
-            
-            return pdf_cmd
-            
-        except Exception:
-            # Se falhar, retornar comando original
-            return cmd
+    def _convert_via_cli(
+        self,
+        input_path: str,
+        output_path: str,
+        output_dir: str,
+        target_format: str,
+        quality: str,
+        temp_dir: str,
+        progress_callback: Optional[Callable] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> tuple[bool, str]:
+        """Converte executando o soffice em linha de comando, gravando em temp_dir.
+        
+        Raises:
+            subprocess.TimeoutExpired: Se o soffice passar do tempo máximo
+            ProcessCancelled: Se cancel_event for acionado (o soffice é encerrado)
+        """
+        logger.debug("Diretório temporário: %s", temp_dir)
+        if progress_callback:
+            progress_callback(20, "Configurando parâmetros de conversão...")
+        
+        # Preparar comando base
+        cmd = [self.executable_path, *self._cmd_templates[target_format], temp_dir, input_path]
+        
+        # Perfil isolado evita que processos paralelos disputem o lock do perfil padrão
+        if self.user_installation:
+            cmd.insert(1, f'-env:UserInstallation={Path(self.user_installation).as_uri()}')
+        
+        # Adicionar configurações específicas para PDF
+        if target_format == 'pdf':
+            cmd = self._add_pdf_options(cmd, quality)
+        
+        logger.debug("Comando: %s", cmd)
+        
+        if progress_callback:
+            progress_callback(30, "Executando LibreOffice...")
+        
+        # Executar conversão
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=temp_dir,
+            **popen_kwargs()
+        )
+        lower_priority(process.pid)
+        stdout, stderr = communicate(process, 300, cancel_event)  # 5 minutos timeout
+        
+        # A saída é capturada em bytes e só decodificada quando for exibida
+        logger.debug("Return code: %s", process.returncode)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("STDOUT: %s", stdout.decode('utf-8', errors='replace'))
+            logger.debug("STDERR: %s", stderr.decode('utf-8', errors='replace'))
+        
+        if progress_callback:
+            progress_callback(80, "Processando resultado...")
+        
+        if process.returncode != 0:
+            error_output = stderr or stdout
+            error_msg = (
+                error_output.decode('utf-8', errors='replace') if error_output
+                else "Erro desconhecido do LibreOffice"
+            )
+            logger.debug("Falha na conversão: %s", error_msg)
+            return False, f"LibreOffice falhou: {error_msg}"
+        
+        # LibreOffice grava <nome do arquivo>.<formato> em --outdir
+        temp_output = os.path.join(temp_dir, f'{Path(input_path).stem}.{target_format}')
+        
+        if not os.path.exists(temp_output):
+            # Fallback defensivo: qualquer arquivo com a extensão esperada
+            with os.scandir(temp_dir) as entries:
+                temp_output = next(
+                    (entry.path for entry in entries
+                     if entry.is_file() and entry.name.endswith(f'.{target_format}')),
+                    None
+                )
+        
+        if not temp_output:
+            return False, "Arquivo de saída não foi criado pelo LibreOffice"
+        
+        # Mover arquivo para destino final (rename atômico quando no mesmo dispositivo)
+        if os.stat(temp_output).st_dev == os.stat(output_dir).st_dev:
+            os.replace(temp_output, output_path)
+        else:
+            shutil.move(temp_output, output_path)
+        
+        if progress_callback:
+            progress_callback(100, "Conversão concluída!")
+        
+        return True, f"Documento convertido com sucesso para {target_format.upper()}"
+    
+    @staticmethod
+    def _clear_directory(path: str):
+        """Remove o conteúdo de um diretório sem remover o próprio diretório."""
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path, ignore_errors=True)
+                    else:
+                        os.remove(entry.path)
+                except OSError:
+                    pass
+    
+    def _add_pdf_options(self, cmd: list, quality: str) -> list:
+        """Adiciona o FilterData do preset de qualidade ao argumento --convert-to.
+        
+        Usa a sintaxe JSON aceita pela linha de comando do LibreOffice
+        (pdf:writer_pdf_Export:{"Chave":{"type":...,"value":...}}).
+        """
+        pdf_settings = self.pdf_quality_settings.get(quality, self.pdf_quality_settings['media'])
+        
+        filter_data = {
+            key: {'type': 'boolean' if value in ('true', 'false') else 'long', 'value': value}
+            for key, value in pdf_settings.items()
+        }
+        
+        pdf_cmd = cmd.copy()
+        pdf_cmd[pdf_cmd.index('--convert-to') + 1] = (
+            f"{self.format_mapping['pdf']}:{json.dumps(filter_data, separators=(',', ':'))}"
+        )
+        
+        return pdf_cmd
     
     def batch_convert(
         self,
@@ -267,47 +571,96 @@ class LibreOfficeEngine:
         output_dir: str,
         target_format: str,
         quality: str = 'media',
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        max_workers: Optional[int] = None
     ) -> tuple[bool, str, list]:
         """Converte múltiplos arquivos em lote.
         
+        Com mais de um worker, os arquivos são distribuídos entre processos
+        soffice independentes, cada um com seu próprio perfil de usuário.
+        
+        Args:
+            max_workers: Número de processos paralelos
+                (padrão: min(núcleos, número de arquivos))
+        
         Returns:
             Tupla (sucesso_geral, mensagem, lista_de_resultados)
         """
         if not self.is_available():
             return False, "LibreOffice não disponível", []
         
-        results = []
-        successful = 0
         total = len(input_files)
+        if max_workers is None:
+            max_workers = min(os.cpu_count() or 1, total)
+        
+        results = [None] * total
+        successful = 0
         
         try:
-            for i, input_file in enumerate(input_files):
-                if progress_callback:
-                    overall_progress = int((i / total) * 100)
-                    progress_callback(overall_progress, f"Convertendo arquivo {i+1} de {total}...")
-                
-                # Gerar nome do arquivo de saída
-                input_name = Path(input_file).stem
-                output_file = os.path.join(output_dir, f"{input_name}.{target_format}")
-                
-                # Converter arquivo individual
-                success, message = self.convert(
-                    input_path=input_file,
-                    output_path=output_file,
-                    target_format=target_format,
-                    quality=quality
-                )
-                
-                results.append({
-                    'input': input_file,
-                    'output': output_file,
-                    'success': success,
-                    'message': message
-                })
-                
-                if success:
-                    successful += 1
+            jobs = [
+                (input_file, os.path.join(output_dir, f"{Path(input_file).stem}.{target_format}"))
+                for input_file in input_files
+            ]
+            
+            # Um único diretório temporário (no destino) para todo o lote; cada
+            # conversão apenas o esvazia ao terminar
+            os.makedirs(output_dir, exist_ok=True)
+            with tempfile.TemporaryDirectory(prefix='.multiconvert_', dir=output_dir) as batch_temp_dir:
+                if max_workers <= 1:
+                    for i, (input_file, output_file) in enumerate(jobs):
+                        if progress_callback:
+                            overall_progress = int((i / total) * 100)
+                            progress_callback(overall_progress, f"Convertendo arquivo {i+1} de {total}...")
+                        
+                        # Converter arquivo individual
+                        success, message = self.convert(
+                            input_path=input_file,
+                            output_path=output_file,
+                            target_format=target_format,
+                            quality=quality,
+                            temp_dir=batch_temp_dir
+                        )
+                        
+                        results[i] = {
+                            'input': input_file,
+                            'output': output_file,
+                            'success': success,
+                            'message': message
+                        }
+                        
+                        if success:
+                            successful += 1
+                else:
+                    with ProcessPoolExecutor(
+                        max_workers=max_workers,
+                        initializer=_init_batch_worker,
+                        initargs=(self.executable_path, batch_temp_dir)
+                    ) as executor:
+                        futures = {
+                            executor.submit(_batch_worker_convert, input_file, output_file, target_format, quality): i
+                            for i, (input_file, output_file) in enumerate(jobs)
+                        }
+                        
+                        for done, future in enumerate(as_completed(futures), start=1):
+                            i = futures[future]
+                            input_file, output_file = jobs[i]
+                            try:
+                                success, message = future.result()
+                            except Exception as e:
+                                success, message = False, f"Erro no worker: {str(e)}"
+                            
+                            results[i] = {
+                                'input': input_file,
+                                'output': output_file,
+                                'success': success,
+                                'message': message
+                            }
+                            
+                            if success:
+                                successful += 1
+                            
+                            if progress_callback:
+                                progress_callback(int((done / total) * 100), f"Convertido arquivo {done} de {total}...")
             
             if progress_callback:
                 progress_callback(100, f"Conversão em lote concluída: {successful}/{total} sucessos")
@@ -318,7 +671,7 @@ class LibreOfficeEngine:
             return overall_success, summary, results
             
         except Exception as e:
-            return False, f"Erro na conversão em lote: {str(e)}", results
+            return False, f"Erro na conversão em lote: {str(e)}", [r for r in results if r is not None]
     
     def get_supported_formats(self) -> dict:
         """Retorna os formatos suportados pelo LibreOffice."""
@@ -371,4 +724,42 @@ class LibreOfficeEngine:
             except Exception:
                 result['test_conversion'] = False
         
-        return result
\ No newline at end of file
+        return result
+
+
+# Engine do processo worker usado por LibreOfficeEngine.batch_convert
+_worker_engine: Optional[LibreOfficeEngine] = None
+_worker_temp_dir: Optional[str] = None
+
+
+def _cleanup_batch_worker():
+    """Encerra o engine do worker e remove seu perfil temporário."""
+    global _worker_engine
+    engine, _worker_engine = _worker_engine, None
+    if engine is not None:
+        engine.close()
+        if engine.user_installation:
+            shutil.rmtree(engine.user_installation, ignore_errors=True)
+
+
+def _init_batch_worker(executable_path: Optional[str], batch_temp_dir: str):
+    """Inicializa um worker de lote com perfil de usuário e diretório temporário exclusivos."""
+    global _worker_engine, _worker_temp_dir
+    _worker_engine = LibreOfficeEngine()
+    _worker_engine.executable_path = executable_path
+    _worker_engine.user_installation = tempfile.mkdtemp(prefix='multiconvert_lo_worker_')
+    _worker_temp_dir = tempfile.mkdtemp(dir=batch_temp_dir)
+    # atexit não roda nos workers do ProcessPoolExecutor (saem por os._exit no POSIX);
+    # finalizadores com exitpriority do multiprocessing rodam antes dessa saída
+    mp_util.Finalize(None, _cleanup_batch_worker, exitpriority=10)
+
+
+def _batch_worker_convert(input_path: str, output_path: str, target_format: str, quality: str) -> tuple[bool, str]:
+    """Converte um arquivo dentro de um worker de lote."""
+    return _worker_engine.convert(
+        input_path=input_path,
+        output_path=output_path,
+        target_format=target_format,
+        quality=quality,
+        temp_dir=_worker_temp_dir
+    )
@@ -11,24 +11,150 @@ Versão: 1.0.0
 """
 
 import os
+import re
+import contextlib
+import functools
 import subprocess
 import tempfile
-import json
 import shutil
+import string
+import asyncio
+import itertools
+import logging
+import queue
 import requests
+import threading
 import time
-from typing import Optional, Callable
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Optional, Callable, Iterator
 from pathlib import Path
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .path_cache import get_cached_executable, store_cached_executable
+from .process_utils import CANCELLED_MESSAGE, CANCEL_POLL_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+# Import condicional do aiohttp (caminho assíncrono para lotes no servidor)
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Conexões simultâneas mantidas pelo pool da sessão HTTP
+HTTP_POOL_MAXSIZE = 50
+
+# Conversões simultâneas no caminho assíncrono (aiohttp)
+ASYNC_MAX_CONCURRENCY = 8
+
+# Validade (segundos) do resultado da verificação do servidor
+SERVER_CHECK_TTL = 30.0
+
+# Diretório compartilhado com o contêiner do Document Server (bind mount)
+SHARED_DIR = "C:\\temp\\onlyoffice-shared"
+
+# Idade (segundos) a partir da qual arquivos esquecidos em SHARED_DIR são removidos
+SHARED_FILE_MAX_AGE = 3600
+
+# Arquivos criados por _shared_file: "multiconvert-<segundos>-<sequência>-<pid><ext>"
+_SHARED_NAME_RE = re.compile(r'multiconvert-(\d+)-\d+-\d+(?:\.\w+)?$')
+
+# Linha de progresso emitida pelo DocumentBuilder (ex.: "progress: 42")
+_PROGRESS_RE = re.compile(r'progress\W*(\d{1,3})', re.IGNORECASE)
+
+# Tamanho dos blocos gravados em disco ao baixar o arquivo convertido
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+
+class ConversionCancelled(Exception):
+    """Sinaliza que o evento de cancelamento de uma conversão foi acionado."""
+
 
 class OnlyOfficeEngine:
     """Engine para conversões usando OnlyOffice DocumentBuilder."""
     
+    # Cabeçalhos da requisição ao ConvertService (o Content-Type vem do parâmetro json=)
+    _CONVERT_HEADERS = {'Accept': 'application/json'}
+    
+    # Formatos de entrada suportados
+    supported_input_formats = frozenset({'txt', 'docx', 'doc', 'odt', 'rtf', 'xlsx', 'xls', 'ods', 'pptx', 'ppt', 'odp'})
+    
+    # Formatos de saída suportados
+    supported_output_formats = frozenset({'pdf', 'docx', 'odt', 'rtf', 'txt', 'html', 'xlsx', 'ods', 'pptx', 'odp'})
+    
+    # Script do DocumentBuilder, compilado uma única vez
+    _SCRIPT_TEMPLATE = string.Template(
+        'builder.OpenFile("$inp");\n'
+        'builder.SaveFile("$fmt", "$out");\n'
+        'builder.CloseFile();\n'
+    )
+    
+    # Formato de saída -> código do OnlyOffice
+    _FORMAT_CODES = {
+        'pdf': 'pdf',
+        'docx': 'docx',
+        'doc': 'doc',
+        'odt': 'odt',
+        'rtf': 'rtf',
+        'txt': 'txt',
+        'html': 'html',
+        'xlsx': 'xlsx',
+        'xls': 'xls',
+        'ods': 'ods',
+        'pptx': 'pptx',
+        'ppt': 'ppt',
+        'odp': 'odp'
+    }
+    
+    # Sequência usada na chave das conversões; o servidor guarda o resultado em
+    # cache por chave, então duas conversões nunca podem compartilhar a mesma
+    _key_counter = itertools.count()
+    _key_lock = threading.Lock()
+    
+    # Evita que várias instâncias limpem SHARED_DIR ao mesmo tempo
+    _scrub_lock = threading.Lock()
+    
+    # Nomes dos arquivos de SHARED_DIR em uso por conversões deste processo
+    _shared_in_use: set[str] = set()
+    _shared_in_use_lock = threading.Lock()
+    
     def __init__(self, executable_path: Optional[str] = None, server_url: str = "http://localhost"):
         self.executable_path = executable_path or self._find_docbuilder()
         self.server_url = server_url.rstrip('/')
         self.use_server = True  # Priorizar servidor sobre executável local
         
+        # Sessão HTTP com pool de conexões, reutilizada entre a requisição de
+        # conversão e o download do resultado. Falhas de conexão e 502/503/504
+        # sob carga são repetidas com backoff (repetir o POST é seguro porque o
+        # servidor identifica a conversão pela key); timeouts de leitura não,
+        # pois um POST travado já esperou o timeout longo da conversão
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=Retry(
+                total=3,
+                read=0,
+                status_forcelist=[502, 503, 504],
+                backoff_factor=0.5,
+                allowed_methods=frozenset(['POST', 'GET'])
+            )
+        )
+        self._session = requests.Session()
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        
+        # Sessão sem repetições para o healthcheck: servidor fora do ar falha na hora
+        self._probe_session = requests.Session()
+        
+        # Último resultado da verificação do servidor: (instante monotônico, disponível)
+        self._avail_cache = (0.0, False)
+        
+        # Remove sobras de execuções interrompidas sem atrasar a inicialização
+        threading.Thread(target=self._scrub_shared_dir, daemon=True).start()
+        
         # Mapeamento de formatos suportados pelo OnlyOffice
         self.format_mapping = {
             # Documentos de texto
@@ -51,15 +177,23 @@ class OnlyOfficeEngine:
             'ppt': 'ppt',
             'odp': 'odp'
         }
-        
-        # Formatos de entrada suportados
-        self.supported_input_formats = ['txt', 'docx', 'doc', 'odt', 'rtf', 'xlsx', 'xls', 'ods', 'pptx', 'ppt', 'odp']
-        
-        # Formatos de saída suportados
-        self.supported_output_formats = ['pdf', 'docx', 'odt', 'rtf', 'txt', 'html', 'xlsx', 'ods', 'pptx', 'odp']
     
     def _find_docbuilder(self) -> Optional[str]:
         """Encontra o executável do DocumentBuilder."""
+        return self._locate_docbuilder()
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _locate_docbuilder() -> Optional[str]:
+        """Procura o DocumentBuilder, consultando antes o cache persistente.
+        
+        O resultado fica em cache no processo (lru_cache) e entre execuções
+        em ~/.multiconvertpro/engines.json, validado pelo mtime do executável.
+        """
+        cached = get_cached_executable('docbuilder')
+        if cached:
+            return cached
+        
         possible_paths = [
             # Caminhos comuns do OnlyOffice no Windows
             r"C:\Program Files\ONLYOFFICE\DocumentServer\core-fonts\docbuilder.exe",
@@ -71,8 +205,11 @@ class OnlyOfficeEngine:
         ]
         
         for path in possible_paths:
-            if os.path.isfile(path) or shutil.which(path):
-                return path
+            found = path if os.path.isfile(path) else shutil.which(path)
+            if found:
+                found = os.path.abspath(found)
+                store_cached_executable('docbuilder', found)
+                return found
         
         return None
     
@@ -83,17 +220,33 @@ class OnlyOfficeEngine:
         return self.executable_path is not None and os.path.exists(self.executable_path)
     
     def _check_server_availability(self) -> bool:
-        """Verifica se o servidor OnlyOffice está rodando."""
+        """Verifica se o servidor OnlyOffice está rodando (resultado em cache por SERVER_CHECK_TTL)."""
+        checked_at, available = self._avail_cache
+        if checked_at and time.monotonic() - checked_at < SERVER_CHECK_TTL:
+            return available
+        
+        available = self._probe_server()
+        self._avail_cache = (time.monotonic(), available)
+        return available
+    
+    def _probe_server(self) -> bool:
+        """Consulta o servidor OnlyOffice (healthcheck ou página inicial)."""
         try:
-            response = requests.get(f"{self.server_url}/healthcheck", timeout=5)
+            response = self._probe_session.get(f"{self.server_url}/healthcheck", timeout=5)
             return response.status_code == 200
         except:
             try:
                 # Tenta endpoint alternativo
-                response = requests.get(f"{self.server_url}/", timeout=5)
+                response = self._probe_session.get(f"{self.server_url}/", timeout=5)
                 return response.status_code == 200
             except:
-                return False   
+                return False
+    
+    def close(self):
+        """Libera as conexões mantidas pelas sessões HTTP."""
+        self._session.close()
+        self._probe_session.close()
+    
     def get_version(self) -> str:
         """Obtém a versão do OnlyOffice DocumentBuilder."""
         if not self.is_available():
@@ -116,7 +269,8 @@ class OnlyOfficeEngine:
         output_path: str,
         target_format: str,
         quality: str = 'media',
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        cancel_event: Optional[threading.Event] = None
     ) -> tuple[bool, str]:
         """Converte um arquivo usando OnlyOffice DocumentBuilder.
         
@@ -126,32 +280,29 @@ class OnlyOfficeEngine:
             target_format: Formato de saída
             quality: Preset de qualidade (não usado pelo OnlyOffice)
             progress_callback: Callback para progresso
+            cancel_event: Evento que, quando acionado, interrompe a conversão
+                (entre linhas do DocumentBuilder ou blocos do download)
             
         Returns:
             Tupla (sucesso, mensagem)
         """
-        print(f"[OnlyOffice] Iniciando conversão: {input_path} -> {output_path} ({target_format})")
-        
-        if not self.is_available():
-            error_msg = "OnlyOffice DocumentBuilder não está disponível"
-            print(f"[OnlyOffice] Erro: {error_msg}")
-            return False, error_msg
+        logger.debug("[OnlyOffice] Iniciando conversão: %s -> %s (%s)", input_path, output_path, target_format)
         
-        if not os.path.exists(input_path):
-            error_msg = f"Arquivo de entrada não encontrado: {input_path}"
-            print(f"[OnlyOffice] Erro: {error_msg}")
-            return False, error_msg
-        
-        input_ext = Path(input_path).suffix.lower().lstrip('.')
+        # Uma única verificação decide tanto a disponibilidade quanto o caminho da conversão
+        server_available = self.use_server and self._check_server_availability()
+        if self.use_server:
+            available = server_available
+        else:
+            available = self.executable_path is not None and os.path.exists(self.executable_path)
         
-        if input_ext not in self.supported_input_formats:
-            error_msg = f"Formato de entrada não suportado: {input_ext}"
-            print(f"[OnlyOffice] Erro: {error_msg}")
+        if not available:
+            error_msg = "OnlyOffice DocumentBuilder não está disponível"
+            logger.debug("[OnlyOffice] Erro: %s", error_msg)
             return False, error_msg
         
-        if target_format not in self.supported_output_formats:
-            error_msg = f"Formato de saída não suportado: {target_format}"
-            print(f"[OnlyOffice] Erro: {error_msg}")
+        error_msg = self._validate_request(input_path, target_format)
+        if error_msg:
+            logger.debug("[OnlyOffice] Erro: %s", error_msg)
             return False, error_msg
         
         try:
@@ -159,17 +310,82 @@ class OnlyOfficeEngine:
                 progress_callback(10, "Preparando conversão OnlyOffice...")
             
             # Usar servidor se disponível, senão usar executável local
-            if self.use_server and self._check_server_availability():
-                return self._convert_via_server(input_path, output_path, target_format, progress_callback)
+            if server_available:
+                return self._convert_via_server(input_path, output_path, target_format, progress_callback, cancel_event)
             else:
-                return self._convert_via_executable(input_path, output_path, target_format, progress_callback)
+                return self._convert_via_executable(input_path, output_path, target_format, progress_callback, cancel_event)
                 
         except Exception as e:
             error_msg = f"Erro durante conversão OnlyOffice: {str(e)}"
-            print(f"[OnlyOffice] Erro: {error_msg}")
+            logger.debug("[OnlyOffice] Erro: %s", error_msg)
             return False, error_msg
     
-    def _convert_via_executable(self, input_path: str, output_path: str, target_format: str, progress_callback: Optional[Callable] = None) -> tuple[bool, str]:
+    def _validate_request(self, input_path: str, target_format: str) -> Optional[str]:
+        """Valida o arquivo de entrada e o formato de saída.
+        
+        Returns:
+            Mensagem de erro, ou None se a conversão puder ser feita
+        """
+        if not os.path.exists(input_path):
+            return f"Arquivo de entrada não encontrado: {input_path}"
+        
+        input_ext = Path(input_path).suffix.lower().lstrip('.')
+        
+        if input_ext not in self.supported_input_formats:
+            return f"Formato de entrada não suportado: {input_ext}"
+        
+        if target_format not in self.supported_output_formats:
+            return f"Formato de saída não suportado: {target_format}"
+        
+        return None
+    
+    def convert_batch(
+        self,
+        jobs: list[tuple[str, str, str]],
+        max_workers: Optional[int] = None,
+        quality: str = 'media',
+        use_async: bool = False
+    ) -> Iterator[tuple[tuple[str, str, str], bool, str]]:
+        """Converte vários arquivos em paralelo.
+        
+        O Document Server atende várias requisições ao mesmo tempo, então cada
+        job roda em uma thread compartilhando a sessão HTTP do engine.
+        
+        Args:
+            jobs: Tuplas (input_path, output_path, target_format)
+            max_workers: Conversões simultâneas (padrão: min(8, núcleos)),
+                limitado ao tamanho do pool de conexões
+            quality: Preset de qualidade aplicado a todos os jobs
+            use_async: Usa convert_batch_async (aiohttp) em um loop próprio
+                via asyncio.run; não pode ser chamado de dentro de um loop ativo
+            
+        Yields:
+            Tuplas (job, sucesso, mensagem) à medida que cada conversão termina
+            (no modo assíncrono, na ordem de `jobs` ao final do lote)
+        """
+        if use_async:
+            yield from asyncio.run(self.convert_batch_async(jobs, max_workers or ASYNC_MAX_CONCURRENCY, quality))
+            return
+        
+        if max_workers is None:
+            max_workers = min(8, os.cpu_count() or 1)
+        max_workers = max(1, min(max_workers, HTTP_POOL_MAXSIZE))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.convert, *job, quality): job
+                for job in jobs
+            }
+            
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    success, message = future.result()
+                except Exception as e:
+                    success, message = False, f"Erro durante conversão OnlyOffice: {str(e)}"
+                yield job, success, message
+    
+    def _convert_via_executable(self, input_path: str, output_path: str, target_format: str, progress_callback: Optional[Callable] = None, cancel_event: Optional[threading.Event] = None) -> tuple[bool, str]:
         """Converte usando o executável local do DocumentBuilder."""
         try:
             # Criar script de conversão temporário
@@ -177,107 +393,150 @@ class OnlyOfficeEngine:
                 input_path, output_path, target_format
             )
             
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.js', delete=False) as script_file:
-                script_file.write(script_content)
-                script_path = script_file.name
-            
-            print(f"[OnlyOffice] Script criado: {script_path}")
-            print(f"[OnlyOffice] Executável: {self.executable_path}")
-            
-            if progress_callback:
-                progress_callback(30, "Executando conversão OnlyOffice...")
-            
-            # Executar o DocumentBuilder
-            result = subprocess.run(
-                [self.executable_path, script_path],
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minutos timeout
-            )
-            
-            print(f"[OnlyOffice] Código de retorno: {result.returncode}")
-            print(f"[OnlyOffice] Stdout: {result.stdout}")
-            print(f"[OnlyOffice] Stderr: {result.stderr}")
+            # O script fica em um diretório temporário removido ao sair do bloco,
+            # mesmo em caso de erro ou timeout
+            with tempfile.TemporaryDirectory(prefix='multiconvert_oo_') as script_dir:
+                script_path = os.path.join(script_dir, 'convert.js')
+                with open(script_path, 'w', encoding='utf-8') as script_file:
+                    script_file.write(script_content)
+                
+                logger.debug("[OnlyOffice] Script criado: %s", script_path)
+                logger.debug("[OnlyOffice] Executável: %s", self.executable_path)
+                
+                if progress_callback:
+                    progress_callback(30, "Executando conversão OnlyOffice...")
+                
+                # Executar o DocumentBuilder
+                returncode, output = self._run_docbuilder(
+                    script_path, progress_callback, timeout=300, cancel_event=cancel_event  # 5 minutos timeout
+                )
             
-            # Limpar arquivo de script temporário
-            try:
-                os.unlink(script_path)
-            except Exception:
-                pass
+            logger.debug("[OnlyOffice] Código de retorno: %s", returncode)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[OnlyOffice] Saída: %s", output)
             
-            if result.returncode == 0:
+            if returncode == 0:
                 if os.path.exists(output_path):
                     if progress_callback:
                         progress_callback(100, "Conversão OnlyOffice concluída!")
                     success_msg = f"Conversão realizada com sucesso usando OnlyOffice"
-                    print(f"[OnlyOffice] Sucesso: {success_msg}")
+                    logger.debug("[OnlyOffice] Sucesso: %s", success_msg)
                     return True, success_msg
                 else:
                     error_msg = f"Arquivo de saída não foi criado: {output_path}"
-                    print(f"[OnlyOffice] Erro: {error_msg}")
+                    logger.debug("[OnlyOffice] Erro: %s", error_msg)
                     return False, error_msg
             else:
-                error_msg = f"Erro na conversão OnlyOffice: {result.stderr or result.stdout}"
-                print(f"[OnlyOffice] Erro: {error_msg}")
+                error_msg = f"Erro na conversão OnlyOffice: {output}"
+                logger.debug("[OnlyOffice] Erro: %s", error_msg)
                 return False, error_msg
                 
+        except ConversionCancelled:
+            return False, CANCELLED_MESSAGE
         except subprocess.TimeoutExpired:
             error_msg = "Timeout na conversão OnlyOffice (5 minutos)"
-            print(f"[OnlyOffice] Erro: {error_msg}")
+            logger.debug("[OnlyOffice] Erro: %s", error_msg)
             return False, error_msg
         except Exception as e:
             error_msg = f"Erro durante conversão OnlyOffice: {str(e)}"
-            print(f"[OnlyOffice] Erro: {error_msg}")
+            logger.debug("[OnlyOffice] Erro: %s", error_msg)
             return False, error_msg
     
-    def _convert_via_server(self, input_path: str, output_path: str, target_format: str, progress_callback: Optional[Callable] = None) -> tuple[bool, str]:
+    def _run_docbuilder(
+        self,
+        script_path: str,
+        progress_callback: Optional[Callable],
+        timeout: int,
+        cancel_event: Optional[threading.Event] = None
+    ) -> tuple[int, str]:
+        """Executa o DocumentBuilder lendo a saída linha a linha.
+        
+        Linhas com "progress: N" movem o progresso entre 30% e 99% enquanto o
+        processo roda, em vez de esperar o fim da conversão.
+        
+        Returns:
+            Tupla (código de retorno, saída combinada de stdout/stderr)
+        
+        Raises:
+            subprocess.TimeoutExpired: Se o tempo máximo for excedido
+            ConversionCancelled: Se cancel_event for acionado durante a execução
+        """
+        process = subprocess.Popen(
+            [self.executable_path, script_path],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            bufsize=1
+        )
+        
+        timed_out = threading.Event()
+        cancelled = threading.Event()
+        finished = threading.Event()
+        
+        def watch():
+            # O DocumentBuilder escreve pouco enquanto converte e o laço de leitura fica
+            # bloqueado: esta thread encerra o processo no timeout ou no cancelamento
+            deadline = time.monotonic() + timeout
+            while not finished.wait(CANCEL_POLL_INTERVAL):
+                if cancel_event is not None and cancel_event.is_set():
+                    cancelled.set()
+                elif time.monotonic() >= deadline:
+                    timed_out.set()
+                else:
+                    continue
+                process.kill()
+                return
+        
+        watcher = threading.Thread(target=watch, daemon=True)
+        watcher.start()
+        output_lines = []
+        try:
+            for line in process.stdout:
+                output_lines.append(line)
+                match = _PROGRESS_RE.search(line) if progress_callback else None
+                if match:
+                    percent = min(int(match.group(1)), 100)
+                    progress_callback(30 + percent * 69 // 100, "Executando conversão OnlyOffice...")
+            process.wait()
+        finally:
+            # Em caso de exceção o processo ainda pode estar rodando: encerra e coleta o status
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            finished.set()
+            watcher.join()
+            process.stdout.close()
+        
+        if cancelled.is_set():
+            raise ConversionCancelled()
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(process.args, timeout)
+        
+        return process.returncode, ''.join(output_lines).strip()
+    
+    def _convert_via_server(self, input_path: str, output_path: str, target_format: str, progress_callback: Optional[Callable] = None, cancel_event: Optional[threading.Event] = None) -> tuple[bool, str]:
         """Converte usando a API do servidor OnlyOffice Document Server."""
         try:
             if progress_callback:
                 progress_callback(20, "Preparando arquivo para conversão...")
             
-            # Usar diretório compartilhado
-            shared_dir = "C:\\temp\\onlyoffice-shared"
-            os.makedirs(shared_dir, exist_ok=True)
-            
-            # Copiar arquivo para diretório compartilhado
-            file_name = os.path.basename(input_path)
-            shared_file_path = os.path.join(shared_dir, file_name)
-            shutil.copy2(input_path, shared_file_path)
-            
-            try:
-                # URL do arquivo para o OnlyOffice (caminho interno do contêiner)
-                file_url = f"file:///var/www/onlyoffice/documentserver/shared/{file_name}"
-                
-                # Determinar formato de saída
-                output_format = target_format.lower()
-                if output_format.startswith('.'):
-                    output_format = output_format[1:]
-                
+            # Disponibilizar o arquivo no diretório compartilhado durante a conversão
+            with self._shared_file(input_path) as file_name:
                 # Preparar dados JSON para a API do OnlyOffice
-                json_data = {
-                    'async': False,
-                    'filetype': os.path.splitext(input_path)[1][1:].lower(),
-                    'key': str(int(time.time())),
-                    'outputtype': output_format,
-                    'title': file_name,
-                    'url': file_url
-                }
+                json_data = self._conversion_payload(input_path, file_name, target_format)
                 
                 if progress_callback:
                     progress_callback(50, "Processando conversão no servidor...")
                 
                 # Fazer requisição de conversão
                 conversion_url = f"{self.server_url}/ConvertService.ashx"
-                headers = {
-                    'Accept': 'application/json',
-                    'Content-Type': 'application/json'
-                }
                 
-                response = requests.post(
-                    conversion_url, 
-                    data=json.dumps(json_data), 
-                    headers=headers, 
+                response = self._session.post(
+                    conversion_url,
+                    json=json_data,
+                    headers=self._CONVERT_HEADERS,
                     timeout=300
                 )
                 
@@ -290,92 +549,297 @@ class OnlyOfficeEngine:
                             if progress_callback:
                                 progress_callback(80, "Baixando arquivo convertido...")
                             
-                            # Baixar arquivo convertido
-                            download_response = requests.get(download_url, timeout=60)
-                            if download_response.status_code == 200:
-                                with open(output_path, 'wb') as output_file:
-                                    output_file.write(download_response.content)
-                                
+                            # Baixar arquivo convertido em blocos, direto para o disco
+                            with self._session.get(download_url, stream=True, timeout=60) as download_response:
+                                download_status = download_response.status_code
+                                if download_status == 200:
+                                    self._write_download(download_response, output_path, progress_callback, cancel_event)
+                            
+                            if download_status == 200:
                                 if progress_callback:
                                     progress_callback(100, "Conversão OnlyOffice Server concluída!")
                                 
                                 success_msg = "Conversão realizada com sucesso usando OnlyOffice Server"
-                                print(f"[OnlyOffice Server] Sucesso: {success_msg}")
+                                logger.debug("[OnlyOffice Server] Sucesso: %s", success_msg)
                                 return True, success_msg
                             else:
-                                error_msg = f"Erro ao baixar arquivo convertido: {download_response.status_code}"
-                                print(f"[OnlyOffice Server] Erro: {error_msg}")
+                                error_msg = f"Erro ao baixar arquivo convertido: {download_status}"
+                                logger.debug("[OnlyOffice Server] Erro: %s", error_msg)
                                 return False, error_msg
                         else:
                             error_msg = "URL de download não fornecida pelo servidor"
-                            print(f"[OnlyOffice Server] Erro: {error_msg}")
+                            logger.debug("[OnlyOffice Server] Erro: %s", error_msg)
                             return False, error_msg
                     else:
                         error_msg = f"Erro na conversão: {result.get('error', 'Erro desconhecido')}"
-                        print(f"[OnlyOffice Server] Erro: {error_msg}")
+                        logger.debug("[OnlyOffice Server] Erro: %s", error_msg)
                         return False, error_msg
                 else:
                     error_msg = f"Erro na requisição: {response.status_code} - {response.text}"
-                    print(f"[OnlyOffice Server] Erro: {error_msg}")
+                    logger.debug("[OnlyOffice Server] Erro: %s", error_msg)
                     return False, error_msg
                     
-            finally:
-                # Limpar arquivo temporário
-                try:
-                    if os.path.exists(shared_file_path):
-                        os.remove(shared_file_path)
-                except:
-                    pass
-                    
+        except ConversionCancelled:
+            return False, CANCELLED_MESSAGE
         except Exception as e:
             error_msg = f"Erro durante conversão via servidor: {str(e)}"
-            print(f"[OnlyOffice Server] Erro: {error_msg}")
+            logger.debug("[OnlyOffice Server] Erro: %s", error_msg)
             return False, error_msg
     
-    def _create_conversion_script(self, input_path: str, output_path: str, target_format: str) -> str:
-        """Cria o script JavaScript para o DocumentBuilder."""
-        # Normalizar caminhos para JavaScript (usar barras normais)
-        input_path_js = input_path.replace('\\', '/')
-        output_path_js = output_path.replace('\\', '/')
+    @classmethod
+    def _conversion_key(cls) -> str:
+        """Gera uma chave única por conversão (segundos, contador e PID do processo)."""
+        with cls._key_lock:
+            sequence = next(cls._key_counter)
+        return f"{int(time.time())}-{sequence}-{os.getpid()}"
+    
+    @staticmethod
+    def _conversion_payload(input_path: str, file_name: str, target_format: str) -> dict:
+        """Monta o corpo da requisição ao ConvertService para um arquivo em SHARED_DIR.
         
-        # Determinar o tipo de documento baseado na extensão de entrada
-        input_ext = Path(input_path).suffix.lower().lstrip('.')
+        O nome do arquivo compartilhado já é único por conversão e serve de chave.
+        """
+        # URL do arquivo para o OnlyOffice (caminho interno do contêiner)
+        file_url = f"file:///var/www/onlyoffice/documentserver/shared/{file_name}"
         
-        if input_ext in ['txt', 'docx', 'doc', 'odt', 'rtf']:
-            doc_type = 'docx'  # Documento de texto
-        elif input_ext in ['xlsx', 'xls', 'ods', 'csv']:
-            doc_type = 'xlsx'  # Planilha
-        elif input_ext in ['pptx', 'ppt', 'odp']:
-            doc_type = 'pptx'  # Apresentação
-        else:
-            doc_type = 'docx'  # Padrão
+        # Determinar formato de saída
+        output_format = target_format.lower()
+        if output_format.startswith('.'):
+            output_format = output_format[1:]
         
-        # Mapear formato de saída para código do OnlyOffice
-        format_codes = {
-            'pdf': 'pdf',
-            'docx': 'docx',
-            'doc': 'doc',
-            'odt': 'odt',
-            'rtf': 'rtf',
-            'txt': 'txt',
-            'html': 'html',
-            'xlsx': 'xlsx',
-            'xls': 'xls',
-            'ods': 'ods',
-            'pptx': 'pptx',
-            'ppt': 'ppt',
-            'odp': 'odp'
+        return {
+            'async': False,
+            'filetype': os.path.splitext(input_path)[1][1:].lower(),
+            'key': Path(file_name).stem,
+            'outputtype': output_format,
+            'title': os.path.basename(input_path),
+            'url': file_url
         }
+    
+    async def convert_batch_async(
+        self,
+        jobs: list[tuple[str, str, str]],
+        max_concurrency: int = ASYNC_MAX_CONCURRENCY,
+        quality: str = 'media'
+    ) -> list[tuple[tuple[str, str, str], bool, str]]:
+        """Converte vários arquivos no servidor em uma única thread com asyncio.
         
-        output_format = format_codes.get(target_format, target_format)
+        As requisições usam uma ClientSession do aiohttp com pool de conexões
+        e no máximo `max_concurrency` conversões em andamento. Sem aiohttp ou
+        sem servidor, cada job roda em thread pelo convert() síncrono.
         
-        script = f"""
-builder.OpenFile("{input_path_js}");
-builder.SaveFile("{output_format}", "{output_path_js}");
-builder.CloseFile();
-"""
+        Args:
+            jobs: Tuplas (input_path, output_path, target_format)
+            max_concurrency: Conversões simultâneas
+            quality: Preset de qualidade (não usado pelo OnlyOffice)
+            
+        Returns:
+            Lista de tuplas (job, sucesso, mensagem) na mesma ordem de `jobs`
+        """
+        if not AIOHTTP_AVAILABLE:
+            logger.warning("[OnlyOffice] aiohttp não está instalado; o lote assíncrono roda em threads")
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        server_available = (
+            AIOHTTP_AVAILABLE and self.use_server
+            and await asyncio.to_thread(self._check_server_availability)
+        )
+        
+        if not server_available:
+            async def run_sync(job):
+                async with semaphore:
+                    return (job, *await asyncio.to_thread(self.convert, *job, quality))
+            
+            return list(await asyncio.gather(*(run_sync(job) for job in jobs)))
+        
+        connector = aiohttp.TCPConnector(limit=HTTP_POOL_MAXSIZE, limit_per_host=20)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            async def run_async(job):
+                input_path, output_path, target_format = job
+                error_msg = self._validate_request(input_path, target_format)
+                if error_msg:
+                    return job, False, error_msg
+                async with semaphore:
+                    return (job, *await self._convert_via_server_async(session, input_path, output_path, target_format))
+            
+            return list(await asyncio.gather(*(run_async(job) for job in jobs)))
+    
+    async def _convert_via_server_async(
+        self,
+        session: 'aiohttp.ClientSession',
+        input_path: str,
+        output_path: str,
+        target_format: str
+    ) -> tuple[bool, str]:
+        """Versão assíncrona (aiohttp) de _convert_via_server."""
+        try:
+            with self._shared_file(input_path) as file_name:
+                json_data = self._conversion_payload(input_path, file_name, target_format)
+                
+                async with session.post(
+                    f"{self.server_url}/ConvertService.ashx",
+                    json=json_data,
+                    headers=self._CONVERT_HEADERS,
+                    timeout=aiohttp.ClientTimeout(total=300)
+                ) as response:
+                    if response.status != 200:
+                        return False, f"Erro na requisição: {response.status} - {await response.text()}"
+                    result = await response.json(content_type=None)
+                
+                if result.get('error') != 0:
+                    return False, f"Erro na conversão: {result.get('error', 'Erro desconhecido')}"
+                
+                download_url = result.get('fileUrl')
+                if not download_url:
+                    return False, "URL de download não fornecida pelo servidor"
+                
+                # Baixar arquivo convertido em blocos; a escrita em disco roda fora do
+                # laço de eventos e o arquivo só assume o nome final se o download terminar
+                async with session.get(download_url, timeout=aiohttp.ClientTimeout(total=60)) as download_response:
+                    if download_response.status != 200:
+                        return False, f"Erro ao baixar arquivo convertido: {download_response.status}"
+                    output_file, temp_path = await asyncio.to_thread(self._open_partial, output_path)
+                    try:
+                        with output_file:
+                            async for chunk in download_response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                                await asyncio.to_thread(output_file.write, chunk)
+                        await asyncio.to_thread(os.replace, temp_path, output_path)
+                    except BaseException:
+                        self._discard_partial(temp_path)
+                        raise
+                
+                return True, "Conversão realizada com sucesso usando OnlyOffice Server"
+                
+        except Exception as e:
+            return False, f"Erro durante conversão via servidor: {str(e)}"
+    
+    @classmethod
+    def _scrub_shared_dir(cls):
+        """Remove de SHARED_DIR os arquivos mais antigos que SHARED_FILE_MAX_AGE.
         
-        return script
+        A idade vem do instante gravado no nome pelo _shared_file, e não do
+        mtime/ctime: um hardlink herda os tempos do arquivo original e pareceria
+        antigo logo ao ser criado. Arquivos fora desse padrão não são tocados.
+        """
+        if not cls._scrub_lock.acquire(blocking=False):
+            return
+        try:
+            cutoff = time.time() - SHARED_FILE_MAX_AGE
+            with os.scandir(SHARED_DIR) as entries:
+                for entry in entries:
+                    try:
+                        match = _SHARED_NAME_RE.match(entry.name)
+                        if not match or entry.name in cls._shared_in_use:
+                            continue
+                        if int(match.group(1)) < cutoff and entry.is_file(follow_symlinks=False):
+                            os.unlink(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        finally:
+            cls._scrub_lock.release()
+    
+    @classmethod
+    @contextlib.contextmanager
+    def _shared_file(cls, input_path: str) -> Iterator[str]:
+        """Disponibiliza o arquivo em SHARED_DIR enquanto o bloco estiver ativo.
+        
+        Usa hardlink quando o arquivo está no mesmo volume (sem copiar dados) e
+        cópia caso contrário; ao sair do bloco, mesmo com erro, o arquivo é removido.
+        O nome vem da chave da conversão, para que entradas com o mesmo nome em
+        pastas diferentes nunca disputem o mesmo arquivo compartilhado.
+        
+        Yields:
+            Nome único do arquivo dentro do diretório compartilhado
+        """
+        os.makedirs(SHARED_DIR, exist_ok=True)
+        
+        file_name = f"multiconvert-{cls._conversion_key()}{Path(input_path).suffix.lower()}"
+        shared_file_path = os.path.join(SHARED_DIR, file_name)
+        with cls._shared_in_use_lock:
+            cls._shared_in_use.add(file_name)
+        
+        try:
+            try:
+                os.link(input_path, shared_file_path)
+            except OSError:
+                shutil.copy2(input_path, shared_file_path)
+            
+            yield file_name
+        finally:
+            try:
+                os.remove(shared_file_path)
+            except OSError:
+                pass
+            with cls._shared_in_use_lock:
+                cls._shared_in_use.discard(file_name)
+    
+    @staticmethod
+    def _open_partial(output_path: str) -> tuple:
+        """Cria, ao lado de output_path, o arquivo temporário que recebe um download.
+        
+        Returns:
+            Tupla (arquivo aberto para escrita binária, caminho temporário)
+        """
+        fd, temp_path = tempfile.mkstemp(
+            prefix='.multiconvert_', suffix='.part', dir=os.path.dirname(os.path.abspath(output_path))
+        )
+        return os.fdopen(fd, 'wb'), temp_path
+    
+    @staticmethod
+    def _discard_partial(temp_path: str):
+        """Remove o arquivo temporário de um download que não terminou."""
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+    
+    @classmethod
+    def _write_download(
+        cls,
+        response,
+        output_path: str,
+        progress_callback: Optional[Callable] = None,
+        cancel_event: Optional[threading.Event] = None
+    ):
+        """Grava a resposta em disco por blocos, reportando o progresso entre 80% e 100%.
+        
+        Os blocos vão para um arquivo temporário que só substitui output_path
+        quando o download termina; em caso de falha ele é removido.
+        
+        Raises:
+            ConversionCancelled: Se cancel_event for acionado; a conexão é
+                descartada e o arquivo parcial removido
+        """
+        total_size = int(response.headers.get('Content-Length') or 0)
+        received = 0
+        
+        output_file, temp_path = cls._open_partial(output_path)
+        try:
+            with output_file:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if cancel_event is not None and cancel_event.is_set():
+                        # Fechar a resposta sem consumi-la descarta o socket em vez de devolvê-lo ao pool
+                        response.close()
+                        raise ConversionCancelled()
+                    output_file.write(chunk)
+                    received += len(chunk)
+                    if progress_callback and total_size:
+                        progress_callback(80 + min(19, received * 20 // total_size), "Baixando arquivo convertido...")
+            os.replace(temp_path, output_path)
+        except BaseException:
+            cls._discard_partial(temp_path)
+            raise
+    
+    def _create_conversion_script(self, input_path: str, output_path: str, target_format: str) -> str:
+        """Cria o script JavaScript para o DocumentBuilder."""
+        # Caminhos com barras normais para JavaScript; formato mapeado para o código do OnlyOffice
+        return self._SCRIPT_TEMPLATE.substitute(
+            inp=input_path.replace('\\', '/'),
+            out=output_path.replace('\\', '/'),
+            fmt=self._FORMAT_CODES.get(target_format, target_format)
+        )
     
     def can_convert(self, input_format: str, output_format: str) -> bool:
         """Verifica se uma conversão específica é suportada."""
@@ -385,7 +849,81 @@ builder.CloseFile();
     def get_supported_conversions(self) -> dict:
         """Retorna as conversões suportadas pelo OnlyOffice."""
         return {
-            'input_formats': self.supported_input_formats,
-            'output_formats': self.supported_output_formats,
+            'input_formats': sorted(self.supported_input_formats),
+            'output_formats': sorted(self.supported_output_formats),
             'engine': 'OnlyOffice DocumentBuilder'
-        }
\ No newline at end of file
+        }
+
+
+class ConversionQueue:
+    """Fila de conversões com prioridade atendida por threads de trabalho.
+    
+    Tarefas com menor valor de prioridade saem primeiro (empates em ordem de
+    chegada). Cada tarefa pode receber um threading.Event de cancelamento:
+    se acionado antes de começar, a tarefa é descartada; durante a execução,
+    o engine interrompe a conversão no próximo ponto de verificação.
+    """
+    
+    def __init__(self, engine: OnlyOfficeEngine, workers: int = 4):
+        self.engine = engine
+        self._queue = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._workers = [
+            threading.Thread(target=self._worker_loop, name=f"OnlyOfficeQueue-{i}", daemon=True)
+            for i in range(max(1, workers))
+        ]
+        for worker in self._workers:
+            worker.start()
+    
+    def enqueue(
+        self,
+        task: tuple[str, str, str],
+        cancel_switch: Optional[threading.Event] = None,
+        priority: int = 0,
+        progress_callback: Optional[Callable] = None
+    ) -> Future:
+        """Enfileira uma conversão.
+        
+        Args:
+            task: Tupla (input_path, output_path, target_format)
+            cancel_switch: Evento de cancelamento da tarefa
+            priority: Prioridade (menor valor é atendido antes)
+            progress_callback: Callback para progresso
+            
+        Returns:
+            Future que recebe a tupla (sucesso, mensagem) da conversão
+        """
+        future = Future()
+        self._queue.put((priority, next(self._sequence), task, cancel_switch, progress_callback, future))
+        return future
+    
+    def shutdown(self, wait: bool = True):
+        """Encerra os workers depois de esvaziar a fila."""
+        for _ in self._workers:
+            self._queue.put((float('inf'), next(self._sequence), None, None, None, None))
+        if wait:
+            for worker in self._workers:
+                worker.join()
+    
+    def _worker_loop(self):
+        """Consome a fila até receber o sinal de encerramento."""
+        while True:
+            _, _, task, cancel_switch, progress_callback, future = self._queue.get()
+            try:
+                if task is None:
+                    return
+                if not future.set_running_or_notify_cancel():
+                    continue
+                if cancel_switch is not None and cancel_switch.is_set():
+                    future.set_result((False, CANCELLED_MESSAGE))
+                    continue
+                try:
+                    future.set_result(self.engine.convert(
+                        *task,
+                        progress_callback=progress_callback,
+                        cancel_event=cancel_switch
+                    ))
+                except Exception as e:
+                    future.set_exception(e)
+            finally:
+                self._queue.task_done()
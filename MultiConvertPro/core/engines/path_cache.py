@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MultiConvert Pro - Cache de executáveis dos engines
+
+Este módulo guarda em ~/.multiconvertpro/engines.json o caminho
+resolvido dos executáveis externos usados pelos engines, validado
+pelo mtime do arquivo, para evitar varrer os caminhos candidatos a
+cada execução do programa.
+
+Autor: MultiConvert Pro Team
+Versão: 1.0.0
+"""
+
+import os
+import json
+import tempfile
+import threading
+from typing import Optional
+from pathlib import Path
+
+# Arquivo de cache compartilhado entre execuções
+CACHE_FILE = Path.home() / '.multiconvertpro' / 'engines.json'
+
+# Serializa as gravações feitas por threads deste processo
+_write_lock = threading.Lock()
+
+
+def _load_cache() -> dict:
+    """Lê o arquivo de cache (dicionário vazio se ausente ou inválido)."""
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as cache_file:
+            data = json.load(cache_file)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def get_cached_executable(name: str) -> Optional[str]:
+    """Retorna o caminho em cache do executável, se ainda for válido.
+    
+    Args:
+        name: Nome do executável no cache (ex.: 'docbuilder')
+    
+    Returns:
+        Caminho do executável ou None se não houver entrada válida
+    """
+    entry = _load_cache().get(name)
+    if not isinstance(entry, dict):
+        return None
+    
+    path = entry.get('path')
+    try:
+        if path and os.path.getmtime(path) == entry.get('mtime'):
+            return path
+    except OSError:
+        pass
+    return None
+
+
+def store_cached_executable(name: str, path: str):
+    """Grava o caminho resolvido do executável no cache (melhor esforço).
+    
+    Args:
+        name: Nome do executável no cache (ex.: 'docbuilder')
+        path: Caminho absoluto do executável encontrado
+    """
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return
+    
+    with _write_lock:
+        data = _load_cache()
+        data[name] = {'path': path, 'mtime': mtime}
+        
+        try:
+            CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            # Grava em arquivo temporário e renomeia, para nunca deixar o cache pela metade
+            fd, temp_path = tempfile.mkstemp(dir=CACHE_FILE.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as temp_file:
+                    json.dump(data, temp_file, indent=2)
+                os.replace(temp_path, CACHE_FILE)
+            except OSError:
+                os.unlink(temp_path)
+                raise
+        except OSError:
+            pass
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MultiConvert Pro - Utilitários de processos externos
+
+Este módulo reúne os ajustes comuns aos processos externos iniciados
+pelos engines (FFmpeg, ffprobe, LibreOffice): sem janela de console e
+com prioridade abaixo da normal, para não disputar a CPU com a interface.
+
+Autor: MultiConvert Pro Team
+Versão: 1.0.0
+"""
+
+import os
+import sys
+import subprocess
+import threading
+import time
+from typing import Optional
+
+# Incremento de nice aplicado aos processos externos no POSIX
+NICE_INCREMENT = 10
+
+# Intervalo (segundos) entre as verificações do evento de cancelamento
+CANCEL_POLL_INTERVAL = 0.2
+
+# Mensagem devolvida quando uma conversão é cancelada pelo chamador
+CANCELLED_MESSAGE = "Conversão cancelada"
+
+
+class ProcessCancelled(Exception):
+    """Sinaliza que um processo externo foi encerrado a pedido do chamador."""
+
+
+def popen_kwargs() -> dict:
+    """Retorna os argumentos extras para iniciar processos externos em segundo plano.
+    
+    No Windows evita a janela de console e usa a classe de prioridade abaixo
+    do normal. Nos demais sistemas não há argumento extra: a prioridade é
+    reduzida depois do spawn com lower_priority(), pois preexec_fn não é
+    seguro com várias threads no processo.
+    
+    Returns:
+        Argumentos para subprocess.run/Popen
+    """
+    if sys.platform == 'win32':
+        return {'creationflags': subprocess.CREATE_NO_WINDOW | subprocess.BELOW_NORMAL_PRIORITY_CLASS}
+    return {}
+
+
+def lower_priority(pid: int):
+    """Reduz a prioridade de um processo já iniciado (melhor esforço, apenas POSIX).
+    
+    No Windows a prioridade já é definida na criação por popen_kwargs().
+    
+    Args:
+        pid: PID do processo filho
+    """
+    if not hasattr(os, 'setpriority'):
+        return
+    try:
+        niceness = min(19, os.getpriority(os.PRIO_PROCESS, 0) + NICE_INCREMENT)
+        os.setpriority(os.PRIO_PROCESS, pid, niceness)
+    except OSError:
+        pass
+
+
+def _kill_and_reap(process: subprocess.Popen):
+    """Encerra o processo e coleta o status (e as saídas pendentes)."""
+    process.kill()
+    process.communicate()
+
+
+def communicate(
+    process: subprocess.Popen,
+    timeout: float,
+    cancel_event: Optional[threading.Event] = None
+) -> tuple:
+    """Aguarda o fim do processo coletando sua saída, como Popen.communicate.
+    
+    Com cancel_event, a espera é feita em fatias de CANCEL_POLL_INTERVAL e o
+    processo é encerrado assim que o evento for acionado.
+    
+    Args:
+        process: Processo iniciado com subprocess.Popen
+        timeout: Tempo máximo em segundos
+        cancel_event: Evento que, quando acionado, encerra o processo
+    
+    Returns:
+        Tupla (stdout, stderr) de Popen.communicate
+    
+    Raises:
+        subprocess.TimeoutExpired: Se o tempo máximo for excedido
+        ProcessCancelled: Se cancel_event for acionado
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            step = remaining if cancel_event is None else min(CANCEL_POLL_INTERVAL, remaining)
+            try:
+                return process.communicate(timeout=step)
+            except subprocess.TimeoutExpired:
+                pass
+        
+        if cancel_event is not None and cancel_event.is_set():
+            _kill_and_reap(process)
+            raise ProcessCancelled()
+        if time.monotonic() >= deadline:
+            _kill_and_reap(process)
+            raise subprocess.TimeoutExpired(process.args, timeout)
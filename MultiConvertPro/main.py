@@ -13,27 +13,17 @@ Licença: MIT
 
 import sys
 import os
+import queue
+import logging
+import logging.handlers
 from pathlib import Path
 
 # Adicionar o diretório raiz ao path para imports
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-try:
-    from PySide6.QtWidgets import QApplication, QMessageBox
-    from PySide6.QtCore import Qt, QDir
-    from PySide6.QtGui import QIcon
-except ImportError as e:
-    print(f"Erro ao importar PySide6: {e}")
-    print("Instale o PySide6 com: pip install PySide6")
-    sys.exit(1)
-
-# Importar a janela principal
-try:
-    from ui.windows.main_window import MainWindow
-except ImportError as e:
-    print(f"Erro ao importar MainWindow: {e}")
-    sys.exit(1)
+# PySide6 e a janela principal são importados apenas ao criar a interface,
+# para que --version/--help respondam sem inicializar o Qt
 
 
 class MultiConvertApp:
@@ -45,6 +35,14 @@ class MultiConvertApp:
         
     def setup_application(self):
         """Configura a aplicação Qt."""
+        try:
+            from PySide6.QtWidgets import QApplication
+            from PySide6.QtGui import QIcon
+        except ImportError as e:
+            print(f"Erro ao importar PySide6: {e}")
+            print("Instale o PySide6 com: pip install PySide6")
+            sys.exit(1)
+        
         # Criar aplicação Qt
         self.app = QApplication(sys.argv)
         
@@ -62,8 +60,22 @@ class MultiConvertApp:
         # Configurar estilo
         self.app.setStyle("Fusion")  # Estilo moderno
         
+        # Folha de estilo única da aplicação (processada uma só vez pelo Qt)
+        style_path = project_root / "ui" / "style.qss"
+        if style_path.exists():
+            self.app.setStyleSheet(style_path.read_text(encoding="utf-8"))
+        
     def create_main_window(self):
         """Cria e configura a janela principal."""
+        from PySide6.QtWidgets import QMessageBox
+        
+        # Importar a janela principal
+        try:
+            from ui.windows.main_window import MainWindow
+        except ImportError as e:
+            print(f"Erro ao importar MainWindow: {e}")
+            sys.exit(1)
+        
         try:
             self.main_window = MainWindow()
             self.main_window.show()
@@ -111,11 +123,29 @@ def main():
             print("Opções:")
             print("  --version, -v    Mostrar versão")
             print("  --help, -h       Mostrar esta ajuda")
+            print("  --debug          Exibir logs de depuração dos engines")
             return 0
     
+    # Configurar logs dos engines (mensagens de depuração apenas com --debug)
+    logging.basicConfig(
+        level=logging.DEBUG if "--debug" in sys.argv else logging.WARNING,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    
+    # As threads de conversão apenas enfileiram os registros; a escrita
+    # no terminal fica com a thread do QueueListener
+    root_logger = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    log_listener = logging.handlers.QueueListener(log_queue, *root_logger.handlers)
+    root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    log_listener.start()
+    
     # Criar e executar aplicação
-    app = MultiConvertApp()
-    return app.run()
+    try:
+        app = MultiConvertApp()
+        return app.run()
+    finally:
+        log_listener.stop()
 
 
 if __name__ == "__main__":
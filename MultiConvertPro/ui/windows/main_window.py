@@ -12,16 +12,45 @@ Versão: 1.0.0
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QPushButton, QListWidget, QComboBox, QProgressBar, QLabel,
-    QFrame, QSplitter, QGroupBox, QStatusBar, QMenuBar, QToolBar
+    QPushButton, QListView, QComboBox, QProgressBar, QLabel,
+    QFrame, QSplitter, QGroupBox, QStatusBar, QMenuBar, QToolBar, QFileDialog
+)
+from PySide6.QtCore import (
+    Qt, QSize, QThread, QTimer, QObject, QRunnable, QThreadPool, QAbstractListModel, QModelIndex, QSettings,
+    Signal, Slot
 )
-from PySide6.QtCore import Qt, QSize, QThread, QTimer, Signal
 from PySide6.QtGui import QAction, QIcon, QFont, QDragEnterEvent, QDropEvent
-import traceback
+import os
+import queue
+import logging
+import threading
+import time
 
 # Importar o motor de conversão
 from core.converters.main_converter import MainConverter
 
+logger = logging.getLogger(__name__)
+
+# Formatos de saída oferecidos no combo, agrupados por categoria
+OUTPUT_FORMAT_GROUPS = (
+    ("Áudio", ("MP3", "WAV", "AAC", "FLAC", "OGG")),
+    ("Vídeo", ("MP4", "MKV", "AVI", "MOV", "WEBM")),
+    ("Imagem", ("JPEG", "PNG", "GIF", "BMP", "TIFF", "WEBP")),
+    ("Documento", ("PDF", "DOCX", "TXT", "ODT", "RTF")),
+)
+
+# Filtros do diálogo de seleção de arquivos
+FILE_DIALOG_FILTER = (
+    "Todos os Arquivos (*.*);;"
+    "Áudio (*.mp3 *.wav *.flac *.aac *.ogg);;"
+    "Vídeo (*.mp4 *.avi *.mkv *.mov *.webm);;"
+    "Imagem (*.jpg *.png *.gif *.bmp *.tiff *.webp);;"
+    "Documento (*.pdf *.docx *.txt *.odt *.rtf)"
+)
+
+# Preset dos conversores para cada item do combo de qualidade (Automática usa média)
+QUALITY_PRESETS = ("media", "baixa", "media", "alta", "maxima")
+
 
 class DragDropWidget(QFrame):
     """Widget personalizado para área de arrastar e soltar."""
@@ -29,8 +58,12 @@ class DragDropWidget(QFrame):
     # Signal para comunicar arquivos soltos
     files_dropped = Signal(list)
     
+    # Fonte do texto principal, criada uma vez e compartilhada entre instâncias
+    _MAIN_FONT = None
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._drag_active = False
         self.setup_ui()
         
     def setup_ui(self):
@@ -46,37 +79,34 @@ class DragDropWidget(QFrame):
         # Label principal
         self.main_label = QLabel("📎 Arraste seus arquivos aqui")
         self.main_label.setAlignment(Qt.AlignCenter)
-        font = QFont()
-        font.setPointSize(16)
-        font.setBold(True)
-        self.main_label.setFont(font)
+        if DragDropWidget._MAIN_FONT is None:
+            font = QFont()
+            font.setPointSize(16)
+            font.setBold(True)
+            DragDropWidget._MAIN_FONT = font
+        self.main_label.setFont(DragDropWidget._MAIN_FONT)
         
         # Label secundário
         self.sub_label = QLabel("✨ ou clique em 'Adicionar Arquivos' para começar")
         self.sub_label.setAlignment(Qt.AlignCenter)
-        self.sub_label.setStyleSheet("color: #6c8cd5; font-size: 12px; font-style: italic;")
+        self.sub_label.setObjectName("dropHint")  # estilo em ui/style.qss
         
         layout.addWidget(self.main_label)
         layout.addWidget(self.sub_label)
         
         self.setLayout(layout)
         
-        # Estilo
-        self.setStyleSheet("""
-            DragDropWidget {
-                border: 2px dashed #4a90e2;
-                border-radius: 15px;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #f8fbff, stop:1 #e8f4fd);
-                color: #2c5aa0;
-            }
-            DragDropWidget:hover {
-                border-color: #0078d4;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e8f4fd, stop:1 #d0e8fc);
-                border-width: 3px;
-            }
-        """)
+        # Estilo em ui/style.qss; o estado de arraste é a propriedade dinâmica dragActive
+        self.setProperty("dragActive", False)
+    
+    def _set_drag_active(self, active: bool):
+        """Alterna o visual de arraste repolindo o widget, sem reprocessar o QSS."""
+        if active == self._drag_active:
+            return
+        self._drag_active = active
+        self.setProperty("dragActive", active)
+        self.style().unpolish(self)
+        self.style().polish(self)
     
     def dragEnterEvent(self, event):
         """Evento quando arquivos são arrastados sobre o widget."""
@@ -86,15 +116,7 @@ class DragDropWidget(QFrame):
             if has_files:
                 event.acceptProposedAction()
                 # Mudar visual para indicar que pode soltar
-                self.setStyleSheet("""
-                    DragDropWidget {
-                        border: 3px solid #0078d4;
-                        border-radius: 15px;
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                            stop:0 #d0e8fc, stop:1 #b8dffb);
-                        color: #1a4480;
-                    }
-                """)
+                self._set_drag_active(True)
             else:
                 event.ignore()
         else:
@@ -103,21 +125,7 @@ class DragDropWidget(QFrame):
     def dragLeaveEvent(self, event):
         """Evento quando o drag sai do widget."""
         # Restaurar visual normal
-        self.setStyleSheet("""
-            DragDropWidget {
-                border: 2px dashed #4a90e2;
-                border-radius: 15px;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #f8fbff, stop:1 #e8f4fd);
-                color: #2c5aa0;
-            }
-            DragDropWidget:hover {
-                border-color: #0078d4;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e8f4fd, stop:1 #d0e8fc);
-                border-width: 3px;
-            }
-        """)
+        self._set_drag_active(False)
     
     def dropEvent(self, event):
         """Evento quando arquivos são soltos no widget."""
@@ -132,46 +140,77 @@ class DragDropWidget(QFrame):
             event.acceptProposedAction()
             
             # Restaurar visual normal
-            self.setStyleSheet("""
-                DragDropWidget {
-                    border: 2px dashed #4a90e2;
-                    border-radius: 15px;
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #f8fbff, stop:1 #e8f4fd);
-                    color: #2c5aa0;
-                }
-                DragDropWidget:hover {
-                    border-color: #0078d4;
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #e8f4fd, stop:1 #d0e8fc);
-                    border-width: 3px;
-                }
-            """)
+            self._set_drag_active(False)
         else:
             event.ignore()
 
 
 class ConversionWorker(QThread):
-    """Worker thread para executar conversões sem travar a UI."""
+    """Worker thread persistente que executa os lotes de conversão sem travar a UI.
+    
+    Criado uma única vez pela janela; cada lote é enfileirado com submit() e
+    processado em ordem. shutdown() encerra a thread após o lote atual.
+    """
     
     progress_updated = Signal(int, str)  # progresso, mensagem
     conversion_finished = Signal(bool, str)  # sucesso, mensagem
+    status_updated = Signal(str)  # mensagem de status do conversor
     
-    def __init__(self, converter, file_paths, output_dir, target_format, quality):
+    def __init__(self, converter):
         super().__init__()
         self.converter = converter
-        self.file_paths = file_paths
-        self.output_dir = output_dir
-        self.target_format = target_format
-        self.quality = quality
-        self.should_stop = False
+        self._jobs = queue.Queue()
+        # Sinal de parada lido pelo laço do worker e pelos conversores durante o arquivo
+        self._stop_event = threading.Event()
+        
+        # Limitar as atualizações de progresso enviadas à UI (~20 por segundo)
+        self._last_emit_ns = 0
+        self._min_interval_ns = 50_000_000
+        self.converter.set_progress_callback(self._emit_progress)
+        # O conversor informa o status a partir desta thread; a UI recebe via sinal
+        self.converter.set_status_callback(self.status_updated.emit)
+    
+    def _emit_progress(self, progress, message):
+        """Repassa o progresso do conversor à UI, descartando atualizações muito próximas.
+        
+        Os valores 0 e 100 são sempre emitidos para que início e fim apareçam na barra.
+        """
+        now = time.monotonic_ns()
+        if progress not in (0, 100) and now - self._last_emit_ns < self._min_interval_ns:
+            return
+        self._last_emit_ns = now
+        self.progress_updated.emit(progress, message)
+    
+    def submit(self, file_paths, output_dir, target_format, quality):
+        """Enfileira um lote de conversão."""
+        self._jobs.put({
+            'files': file_paths,
+            'output_dir': output_dir,
+            'target_format': target_format,
+            'quality': quality
+        })
+    
+    def shutdown(self):
+        """Pede o encerramento da thread depois do lote atual."""
+        self._stop_event.set()
+        self._jobs.put(None)
     
     def run(self):
-        """Executa a conversão em thread separada com tratamento de erro robusto."""
+        """Atende os lotes enfileirados até receber o sinal de encerramento."""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            self._stop_event.clear()
+            self._last_emit_ns = 0
+            self._convert_job(job)
+    
+    def _convert_job(self, job):
+        """Executa um lote com tratamento de erro robusto."""
         try:
             # Inicia a conversão
             success = self.converter.start_conversion(
-                self.file_paths, self.output_dir, self.target_format, self.quality
+                job['files'], job['output_dir'], job['target_format'], job['quality']
             )
             
             if not success:
@@ -179,16 +218,13 @@ class ConversionWorker(QThread):
                 return
             
             # Processa jobs um por um
-            while self.converter.is_converting and not self.should_stop:
-                success, has_more = self.converter.process_next_job()
+            while self.converter.is_converting and not self._stop_event.is_set():
+                success, has_more = self.converter.process_next_job(self._stop_event)
                 
                 if not has_more:
                     break
-                
-                # Pequena pausa para não sobrecarregar
-                self.msleep(100)
             
-            if self.should_stop:
+            if self._stop_event.is_set():
                 self.converter.stop_conversion()
                 self.conversion_finished.emit(False, "Conversão interrompida")
             else:
@@ -200,35 +236,163 @@ class ConversionWorker(QThread):
                     
         except Exception as e:
             # CAPTURA QUALQUER ERRO FATAL QUE POSSA CAUSAR CRASH
-            print("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
-            print("!!! ERRO FATAL CAPTURADO NA THREAD DE CONVERSÃO !!!")
-            print("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
-            
-            # Imprime o erro completo com a linha exata onde aconteceu
-            traceback.print_exc()
+            # O traceback completo vai para o log (fila atendida fora desta thread)
+            logger.exception("Erro fatal capturado na thread de conversão")
             
             # Emite um sinal para a UI informando sobre o crash
             error_message = f"Erro fatal na thread: {type(e).__name__}: {str(e)}"
             self.conversion_finished.emit(False, error_message)
     
     def stop(self):
-        """Para a conversão."""
-        self.should_stop = True
+        """Para o lote em andamento."""
+        self._stop_event.set()
+
+
+class ConversionTaskSignals(QObject):
+    """Sinais compartilhados pelas tarefas de conversão paralela."""
+    
+    task_progress = Signal(str, int, str)  # arquivo, progresso do arquivo, mensagem
+    task_finished = Signal(str, bool, str)  # arquivo, sucesso, mensagem
+
+
+class ConversionTask(QRunnable):
+    """Conversão de um único arquivo executada no QThreadPool."""
+    
+    def __init__(self, converter, signals, stop_event, file_path, output_dir, target_format, quality):
+        super().__init__()
+        self.converter = converter
+        self.signals = signals
+        self.stop_event = stop_event
+        self.file_path = file_path
+        self.output_dir = output_dir
+        self.target_format = target_format
+        self.quality = quality
+        
+        # Mesmo limite do ConversionWorker (~20 atualizações por segundo)
+        self._last_emit_ns = 0
+        self._min_interval_ns = 50_000_000
+    
+    def _emit_progress(self, progress, message):
+        """Repassa o progresso do arquivo à UI, descartando atualizações muito próximas."""
+        now = time.monotonic_ns()
+        if now - self._last_emit_ns < self._min_interval_ns:
+            return
+        self._last_emit_ns = now
+        self.signals.task_progress.emit(self.file_path, int(progress), message)
+    
+    def run(self):
+        """Converte o arquivo, a menos que a parada já tenha sido pedida."""
+        if self.stop_event.is_set():
+            success, message = False, "Conversão interrompida"
+        else:
+            try:
+                success, message = self.converter.convert_one(
+                    self.file_path, self.output_dir, self.target_format, self.quality,
+                    progress_callback=self._emit_progress,
+                    cancel_event=self.stop_event
+                )
+            except Exception as e:
+                logger.exception("Erro fatal capturado na tarefa de conversão")
+                success, message = False, f"Erro fatal na tarefa: {type(e).__name__}: {str(e)}"
+        
+        self.signals.task_finished.emit(self.file_path, success, message)
+
+
+class FileListModel(QAbstractListModel):
+    """Modelo somente leitura da lista de arquivos, sobre uma lista Python de caminhos.
+    
+    A lista é compartilhada com a janela; as alterações devem passar por
+    append_paths() e reset_paths() para que a view seja avisada.
+    """
+    
+    def __init__(self, paths, parent=None):
+        super().__init__(parent)
+        self._paths = paths
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._paths)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._paths[index.row()]
+        return None
+    
+    def append_paths(self, paths):
+        """Acrescenta os caminhos ao final com uma única notificação de inserção."""
+        if not paths:
+            return
+        first = len(self._paths)
+        self.beginInsertRows(QModelIndex(), first, first + len(paths) - 1)
+        self._paths.extend(paths)
+        self.endInsertRows()
+    
+    def reset_paths(self, paths):
+        """Substitui todos os caminhos (a seleção da view é descartada)."""
+        self.beginResetModel()
+        self._paths[:] = paths
+        self.endResetModel()
 
 
 class MainWindow(QMainWindow):
     """Janela principal da aplicação MultiConvert Pro."""
     
+    # Textos da contagem de arquivos já formatados para as quantidades mais comuns
+    _COUNT_LABELS = ["0 arquivos", "1 arquivo"] + [f"{i} arquivos" for i in range(2, 256)]
+    
+    # Tempo máximo (ms) de espera pelas conversões em andamento ao fechar a janela
+    _CLOSE_TIMEOUT_MS = 5000
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
         # Inicializar o conversor
         self.converter = MainConverter()
-        self.conversion_worker = None
-        
-        # Configurar callbacks do conversor
-        self.converter.set_progress_callback(self.on_conversion_progress)
-        self.converter.set_status_callback(self.on_conversion_status)
+        # Lote em andamento no worker em série
+        self._serial_active = False
+        
+        # Caminhos da lista de arquivos (fonte do modelo exibido em file_list)
+        self._file_paths: list[str] = []
+        
+        # Progresso recebido do worker, aplicado aos widgets pelo timer (~12 vezes por segundo)
+        self._pending_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(80)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        
+        # Última contagem exibida na barra de status
+        self._shown_file_count = 0
+        # Agrupa as mudanças seguidas na lista em uma única atualização da contagem
+        self._count_timer = QTimer(self)
+        self._count_timer.setSingleShot(True)
+        self._count_timer.setInterval(30)
+        self._count_timer.timeout.connect(self.update_file_count)
+        
+        # Diálogo de seleção de arquivos, criado no primeiro uso e reaproveitado
+        self._file_dialog = None
+        
+        # Última pasta de destino escolhida, lembrada entre execuções
+        self._settings = QSettings("MultiConvertPro", "MainWindow")
+        self._last_dest = self._settings.value("last_dest", "", str)
+        
+        # Conversão paralela de mídia: um arquivo por tarefa, até um por núcleo
+        self._thread_pool = QThreadPool.globalInstance()
+        self._thread_pool.setMaxThreadCount(QThread.idealThreadCount())
+        # Sem pai: as tarefas ainda na fila mantêm o objeto vivo após o fechamento da janela
+        self._task_signals = ConversionTaskSignals()
+        self._task_signals.task_progress.connect(self.on_task_progress, Qt.QueuedConnection)
+        self._task_signals.task_finished.connect(self.on_task_finished, Qt.QueuedConnection)
+        self._parallel_stop = None
+        self._parallel_total = 0
+        self._parallel_done = 0
+        self._parallel_failed = 0
+        # Arquivos do lote descartados por formato não suportado
+        self._parallel_skipped = 0
+        # Progresso individual (0-100) de cada arquivo do lote e sua soma
+        self._parallel_progress: dict[str, int] = {}
+        self._parallel_progress_sum = 0
+        
+        # Worker em série criado uma vez e reaproveitado entre conversões
+        self._start_worker()
         
         self.setup_ui()
         self.setup_connections()
@@ -240,167 +404,7 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(800, 600)
         self.resize(1000, 700)
         
-        # Aplicar estilo geral moderno azul
-        self.setStyleSheet("""
-            QMainWindow {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #f0f8ff, stop:1 #e6f3ff);
-            }
-            
-            QGroupBox {
-                font-weight: bold;
-                font-size: 12px;
-                color: #2c5aa0;
-                border: 2px solid #4a90e2;
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ffffff, stop:1 #f8fbff);
-            }
-            
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 8px 0 8px;
-                background-color: #ffffff;
-                border-radius: 5px;
-            }
-            
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #5ba0f2, stop:1 #4a90e2);
-                color: white;
-                border: 1px solid #3a7bd5;
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-weight: bold;
-                font-size: 11px;
-                min-height: 20px;
-            }
-            
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #6bb0ff, stop:1 #5ba0f2);
-                border-color: #2c5aa0;
-            }
-            
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #3a7bd5, stop:1 #2c5aa0);
-            }
-            
-            QPushButton:disabled {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #cccccc, stop:1 #bbbbbb);
-                color: #666666;
-                border-color: #aaaaaa;
-            }
-            
-            QComboBox {
-                border: 2px solid #4a90e2;
-                border-radius: 6px;
-                padding: 6px;
-                background: white;
-                color: #2c5aa0;
-                font-weight: bold;
-            }
-            
-            QComboBox:hover {
-                border-color: #0078d4;
-            }
-            
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid #4a90e2;
-                margin-right: 5px;
-            }
-            
-            QListWidget {
-                border: 2px solid #4a90e2;
-                border-radius: 8px;
-                background: white;
-                alternate-background-color: #f8fbff;
-                selection-background-color: #d0e8fc;
-                color: #2c5aa0;
-            }
-            
-            QListWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #e0e0e0;
-            }
-            
-            QListWidget::item:selected {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #d0e8fc, stop:1 #b8ddf9);
-                color: #1a4480;
-            }
-            
-            QProgressBar {
-                border: 2px solid #4a90e2;
-                border-radius: 8px;
-                text-align: center;
-                font-weight: bold;
-                color: #2c5aa0;
-                background: white;
-            }
-            
-            QProgressBar::chunk {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #5ba0f2, stop:1 #4a90e2);
-                border-radius: 6px;
-                margin: 1px;
-            }
-            
-            QLabel {
-                color: #2c5aa0;
-                font-weight: bold;
-            }
-            
-            QStatusBar {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ffffff, stop:1 #f0f8ff);
-                border-top: 1px solid #4a90e2;
-                color: #2c5aa0;
-            }
-            
-            QMenuBar {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ffffff, stop:1 #f0f8ff);
-                color: #2c5aa0;
-                border-bottom: 1px solid #4a90e2;
-            }
-            
-            QMenuBar::item {
-                padding: 6px 12px;
-                background: transparent;
-            }
-            
-            QMenuBar::item:selected {
-                background: #d0e8fc;
-                border-radius: 4px;
-            }
-            
-            QToolBar {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ffffff, stop:1 #f0f8ff);
-                border-bottom: 1px solid #4a90e2;
-                spacing: 3px;
-            }
-            
-            QToolBar::separator {
-                background: #4a90e2;
-                width: 1px;
-                margin: 5px;
-            }
-        """)
+        # O estilo geral fica em ui/style.qss, aplicado na QApplication por main.py
         
         # Widget central
         central_widget = QWidget()
@@ -505,8 +509,18 @@ class MainWindow(QMainWindow):
         file_group = QGroupBox("Arquivos para Conversão")
         file_layout = QVBoxLayout(file_group)
         
-        self.file_list = QListWidget()
+        # Os caminhos são só texto: o modelo lê direto de _file_paths, sem um item por arquivo
+        self.file_list_model = FileListModel(self._file_paths, self)
+        self.file_list = QListView()
+        self.file_list.setObjectName("fileList")
+        self.file_list.setModel(self.file_list_model)
+        self.file_list.setEditTriggers(QListView.NoEditTriggers)
         self.file_list.setMinimumHeight(200)
+        # Todos os itens têm a mesma altura: o layout não precisa medir item a item
+        self.file_list.setUniformItemSizes(True)
+        self.file_list.setViewMode(QListView.ListMode)
+        self.file_list.setLayoutMode(QListView.Batched)
+        self.file_list.setBatchSize(256)
         file_layout.addWidget(self.file_list)
         
         # Botões de controle da lista
@@ -533,18 +547,15 @@ class MainWindow(QMainWindow):
         format_layout = QHBoxLayout()
         format_layout.addWidget(QLabel("Formato de Saída:"))
         
+        # O formato fica no userData de cada item; placeholder e separadores não têm formato
         self.output_format_combo = QComboBox()
-        self.output_format_combo.addItems([
-            "Selecione o formato...",
-            "--- Áudio ---",
-            "MP3", "WAV", "AAC", "FLAC", "OGG",
-            "--- Vídeo ---",
-            "MP4", "MKV", "AVI", "MOV", "WEBM",
-            "--- Imagem ---",
-            "JPEG", "PNG", "GIF", "BMP", "TIFF", "WEBP",
-            "--- Documento ---",
-            "PDF", "DOCX", "TXT", "ODT", "RTF"
-        ])
+        self.output_format_combo.addItem("Selecione o formato...", None)
+        for group, formats in OUTPUT_FORMAT_GROUPS:
+            self.output_format_combo.addItem(f"--- {group} ---", None)
+            # Separadores não podem ser escolhidos (o modelo padrão do combo é um QStandardItemModel)
+            self.output_format_combo.model().item(self.output_format_combo.count() - 1).setEnabled(False)
+            for target_format in formats:
+                self.output_format_combo.addItem(target_format, target_format)
         format_layout.addWidget(self.output_format_combo)
         format_layout.addStretch()
         
@@ -569,7 +580,9 @@ class MainWindow(QMainWindow):
         dest_layout.addWidget(QLabel("Pasta de Destino:"))
         
         self.dest_path_label = QLabel("Mesma pasta dos arquivos originais")
-        self.dest_path_label.setStyleSheet("color: gray; font-style: italic;")
+        # Visual definido em style.qss; destSet alterna entre o texto padrão e a pasta escolhida
+        self.dest_path_label.setObjectName("destPath")
+        self._dest_set = False
         dest_layout.addWidget(self.dest_path_label)
         
         self.browse_dest_btn = QPushButton("📂 Procurar...")
@@ -593,65 +606,13 @@ class MainWindow(QMainWindow):
         # Botão principal de conversão
         self.convert_btn = QPushButton("🚀 Iniciar Conversão")
         self.convert_btn.setMinimumHeight(45)
-        self.convert_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #0078d4, stop:1 #005a9e);
-                color: white;
-                border: 2px solid #004578;
-                border-radius: 12px;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 10px 20px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #106ebe, stop:1 #0078d4);
-                border-color: #003a5f;
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #004578, stop:1 #003a5f);
-            }
-            QPushButton:disabled {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #cccccc, stop:1 #bbbbbb);
-                color: #666666;
-                border-color: #aaaaaa;
-            }
-        """)
+        self.convert_btn.setObjectName("convertBtn")
         self.convert_btn.setEnabled(False)  # Desabilitado inicialmente
         
         # Botão de parar
         self.stop_btn = QPushButton("⏹️ Parar")
         self.stop_btn.setMinimumHeight(45)
-        self.stop_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e74c3c, stop:1 #c0392b);
-                color: white;
-                border: 2px solid #a93226;
-                border-radius: 12px;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 10px 20px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ec7063, stop:1 #e74c3c);
-                border-color: #922b21;
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #a93226, stop:1 #922b21);
-            }
-            QPushButton:disabled {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #cccccc, stop:1 #bbbbbb);
-                color: #666666;
-                border-color: #aaaaaa;
-            }
-        """)
+        self.stop_btn.setObjectName("stopBtn")
         self.stop_btn.setEnabled(False)
         
         controls_layout.addStretch()
@@ -673,6 +634,8 @@ class MainWindow(QMainWindow):
         
         # Label de status
         self.status_label = QLabel("Pronto para conversão")
+        self._last_status_text = self.status_label.text()
+        self._last_progress = self.progress_bar.value()
         self.status_label.setAlignment(Qt.AlignCenter)
         
         progress_layout.addWidget(self.status_label)
@@ -686,7 +649,7 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self.status_bar)
         
         # Mensagem inicial
-        self.status_bar.showMessage("MultiConvert Pro v1.0.0 - Pronto")
+        self._show_status_message("MultiConvert Pro v1.0.0 - Pronto")
         
         # Label para contagem de arquivos
         self.file_count_label = QLabel("0 arquivos")
@@ -707,10 +670,10 @@ class MainWindow(QMainWindow):
         self.stop_btn.clicked.connect(self.on_stop)
         
         # Combo de formato
-        self.output_format_combo.currentTextChanged.connect(self.on_format_changed)
+        self.output_format_combo.currentIndexChanged.connect(self.on_format_changed)
         
         # Lista de arquivos
-        self.file_list.itemSelectionChanged.connect(self.on_selection_changed)
+        self.file_list.selectionModel().selectionChanged.connect(self.on_selection_changed)
         
         # Botão de procurar pasta
         self.browse_dest_btn.clicked.connect(self.on_browse_destination)
@@ -719,97 +682,114 @@ class MainWindow(QMainWindow):
         self.drag_drop_widget.files_dropped.connect(self.on_files_dropped)
         
     # Métodos de callback (implementação funcional)
+    @Slot()
     def on_add_files(self):
         """Callback para adicionar arquivos."""
-        from PySide6.QtWidgets import QFileDialog
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(self, "Selecionar Arquivos para Conversão")
+            self._file_dialog.setFileMode(QFileDialog.ExistingFiles)
+            self._file_dialog.setNameFilter(FILE_DIALOG_FILTER)
         
-        files, _ = QFileDialog.getOpenFileNames(
-            self,
-            "Selecionar Arquivos para Conversão",
-            "",
-            "Todos os Arquivos (*.*);;Áudio (*.mp3 *.wav *.flac *.aac *.ogg);;Vídeo (*.mp4 *.avi *.mkv *.mov *.webm);;Imagem (*.jpg *.png *.gif *.bmp *.tiff *.webp);;Documento (*.pdf *.docx *.txt *.odt *.rtf)"
-        )
+        files = self._file_dialog.selectedFiles() if self._file_dialog.exec() else []
         
         if files:
+            # Ignorar arquivos que já estão na lista (conjunto montado uma única vez)
+            existing = set(self._file_paths)
+            to_add = []
             for file_path in files:
-                # Verificar se o arquivo já está na lista
-                existing_items = [self.file_list.item(i).text() for i in range(self.file_list.count())]
-                if file_path not in existing_items:
-                    self.file_list.addItem(file_path)
+                if file_path not in existing:
+                    to_add.append(file_path)
+                    existing.add(file_path)
+            self._append_files(to_add)
             
-            self.update_file_count()
-            self.status_bar.showMessage(f"{len(files)} arquivo(s) adicionado(s)")
+            self._schedule_count_update()
+            self._show_status_message(f"{len(files)} arquivo(s) adicionado(s)")
         
+    @Slot()
     def on_remove_files(self):
         """Callback para remover arquivos."""
-        selected_items = self.file_list.selectedItems()
-        if selected_items:
-            for item in selected_items:
-                row = self.file_list.row(item)
-                self.file_list.takeItem(row)
+        selected_rows = {index.row() for index in self.file_list.selectionModel().selectedRows()}
+        if selected_rows:
+            self._reset_file_list([
+                path for row, path in enumerate(self._file_paths) if row not in selected_rows
+            ])
             
-            self.update_file_count()
-            self.status_bar.showMessage(f"{len(selected_items)} arquivo(s) removido(s)")
+            self._schedule_count_update()
+            self._show_status_message(f"{len(selected_rows)} arquivo(s) removido(s)")
         else:
-            self.status_bar.showMessage("Nenhum arquivo selecionado para remover")
+            self._show_status_message("Nenhum arquivo selecionado para remover")
         
+    def _append_files(self, file_paths):
+        """Acrescenta os caminhos à lista e atualiza o modelo em uma única operação."""
+        self.file_list_model.append_paths(file_paths)
+    
+    def _reset_file_list(self, file_paths):
+        """Substitui o conteúdo da lista de arquivos."""
+        self.file_list_model.reset_paths(file_paths)
+        # O reset do modelo limpa a seleção sem emitir selectionChanged
+        self.on_selection_changed()
+    
+    @Slot()
     def on_clear_list(self):
         """Callback para limpar lista."""
-        if self.file_list.count() > 0:
-            self.file_list.clear()
-            self.update_file_count()
-            self.status_bar.showMessage("Lista limpa")
+        if self._file_paths:
+            self._reset_file_list([])
+            self._schedule_count_update()
+            self._show_status_message("Lista limpa")
     
+    @Slot(list)
     def on_files_dropped(self, files):
         """Callback para arquivos soltos via drag & drop."""
+        # Ignorar arquivos que já estão na lista (conjunto montado uma única vez)
+        existing = set(self._file_paths)
         added_files = []
         for file_path in files:
-            # Verificar se o arquivo já está na lista
-            existing_items = [self.file_list.item(i).text() for i in range(self.file_list.count())]
-            if file_path not in existing_items:
-                self.file_list.addItem(file_path)
+            if file_path not in existing:
                 added_files.append(file_path)
+                existing.add(file_path)
         
         if added_files:
-            self.update_file_count()
-            self.status_bar.showMessage(f"{len(added_files)} arquivo(s) adicionado(s) via drag & drop")
+            self._append_files(added_files)
+            self._schedule_count_update()
+            self._show_status_message(f"{len(added_files)} arquivo(s) adicionado(s) via drag & drop")
         else:
-            self.status_bar.showMessage("Arquivos já estão na lista")
+            self._show_status_message("Arquivos já estão na lista")
         
+    @Slot()
     def on_convert(self):
         """Callback para iniciar conversão real."""
-        if self.file_list.count() == 0:
-            self.status_bar.showMessage("Adicione arquivos antes de converter")
+        if self._is_converting():
+            # Um segundo lote sobrescreveria o estado e o sinal de parada do lote atual
+            self._show_status_message("Aguarde o fim da conversão em andamento")
+            return
+        
+        if not self._file_paths:
+            self._show_status_message("Adicione arquivos antes de converter")
             return
             
-        format_text = self.output_format_combo.currentText()
-        if not format_text or format_text.startswith("---") or format_text == "Selecione o formato...":
-            self.status_bar.showMessage("Selecione um formato de saída")
+        format_text = self.output_format_combo.currentData()
+        if format_text is None:
+            self._show_status_message("Selecione um formato de saída")
             return
         
         # Obter lista de arquivos
-        file_paths = []
-        for i in range(self.file_list.count()):
-            file_paths.append(self.file_list.item(i).text())
+        file_paths = list(self._file_paths)
         
         # Obter pasta de destino
         dest_text = self.dest_path_label.text()
         if dest_text == "Mesma pasta dos arquivos originais":
             # Usar a pasta do primeiro arquivo como padrão
-            import os
             output_dir = os.path.dirname(file_paths[0]) if file_paths else ""
         else:
             output_dir = dest_text
         
         # Obter qualidade
-        quality = self.quality_combo.currentText()
-        if quality == "Automática":
-            quality = "Média"
+        quality = QUALITY_PRESETS[self.quality_combo.currentIndex()]
         
         # Validar configuração antes de iniciar
         is_valid, message = self.converter.validate_conversion_setup(file_paths, output_dir, format_text)
         if not is_valid:
-            self.status_bar.showMessage(f"Erro: {message}")
+            self._show_status_message("Erro: " + message)
             return
         
         # Configurar UI para conversão
@@ -817,110 +797,310 @@ class MainWindow(QMainWindow):
         self.stop_btn.setEnabled(True)
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 100)
-        self.progress_bar.setValue(0)
+        self._set_progress(0)
         
-        self.status_label.setText(f"Iniciando conversão para {format_text}...")
-        self.status_bar.showMessage("Conversão iniciada")
+        self._set_status_text(f"Iniciando conversão para {format_text}...")
+        self._show_status_message("Conversão iniciada")
         
-        # Criar e iniciar worker thread
-        self.conversion_worker = ConversionWorker(
-            self.converter, file_paths, output_dir, format_text, quality
-        )
+        # Arquivos de mídia são independentes: cada um vira uma tarefa no QThreadPool.
+        # Documentos seguem em série pelo worker
+        if all(self.converter.is_parallel_safe(path) for path in file_paths):
+            self._start_parallel_conversion(file_paths, output_dir, format_text, quality)
+            return
         
-        # Conectar sinais
-        self.conversion_worker.progress_updated.connect(self.on_worker_progress)
-        self.conversion_worker.conversion_finished.connect(self.on_conversion_finished)
+        # Enfileirar o lote no worker em série
+        self._serial_active = True
+        self._progress_timer.start()
+        self.conversion_worker.submit(file_paths, output_dir, format_text, quality)
+        
+    def _start_parallel_conversion(self, file_paths, output_dir, target_format, quality):
+        """Distribui os arquivos convertíveis em tarefas no pool de threads.
+        
+        Só recebe arquivos de PARALLEL_SAFE_TYPES: os conversores de mídia não
+        guardam estado por conversão, então as tarefas compartilham o conversor.
+        """
+        supported = [
+            path for path in file_paths
+            if self.converter.is_format_supported(os.path.splitext(path)[1].lstrip('.'), target_format)
+        ]
+        skipped = len(file_paths) - len(supported)
+        
+        if not supported:
+            self.on_conversion_finished(
+                False, f"Nenhum arquivo pode ser convertido para {target_format} ({skipped} ignorado(s))"
+            )
+            return
         
-        # Iniciar conversão em thread separada
-        self.conversion_worker.start()
+        if skipped:
+            self._show_status_message(f"{skipped} arquivo(s) ignorado(s): conversão para {target_format} não suportada")
+        
+        file_paths = supported
+        self._parallel_stop = threading.Event()
+        self._parallel_total = len(file_paths)
+        self._parallel_skipped = skipped
+        self._parallel_done = 0
+        self._parallel_failed = 0
+        self._parallel_progress = dict.fromkeys(file_paths, 0)
+        self._parallel_progress_sum = 0
+        
+        for path in file_paths:
+            self._thread_pool.start(ConversionTask(
+                self.converter, self._task_signals, self._parallel_stop,
+                path, output_dir, target_format, quality
+            ))
+    
+    def _record_task_progress(self, file_path, progress):
+        """Atualiza o progresso de um arquivo e reflete a média do lote na barra."""
+        previous = self._parallel_progress.get(file_path)
+        if previous is None:
+            return
+        progress = max(0, min(progress, 100))
+        self._parallel_progress[file_path] = progress
+        self._parallel_progress_sum += progress - previous
+        self._set_progress(self._parallel_progress_sum // self._parallel_total)
+    
+    @Slot(str, int, str)
+    def on_task_progress(self, file_path, progress, message):
+        """Callback para o progresso de um arquivo na conversão paralela."""
+        if self._parallel_stop is None:
+            return
+        self._record_task_progress(file_path, progress)
+        if message:
+            self._set_status_text(f"{os.path.basename(file_path)}: {message}")
+    
+    @Slot(str, bool, str)
+    def on_task_finished(self, file_path, success, message):
+        """Callback para cada arquivo concluído na conversão paralela."""
+        self._parallel_done += 1
+        if not success:
+            self._parallel_failed += 1
+        
+        self._record_task_progress(file_path, 100)
+        self._set_status_text(
+            f"{os.path.basename(file_path)}: {message} ({self._parallel_done}/{self._parallel_total})"
+        )
         
+        if self._parallel_done < self._parallel_total:
+            return
+        
+        stopped = self._parallel_stop.is_set()
+        self._parallel_stop = None
+        skipped_note = f" {self._parallel_skipped} arquivo(s) ignorado(s)." if self._parallel_skipped else ""
+        if stopped:
+            self.on_conversion_finished(False, "Conversão interrompida")
+        elif self._parallel_failed == 0:
+            self.on_conversion_finished(
+                True, f"Conversão concluída! {self._parallel_total} arquivo(s) convertido(s).{skipped_note}"
+            )
+        else:
+            self.on_conversion_finished(
+                False, f"Conversão finalizada com {self._parallel_failed} erro(s).{skipped_note}"
+            )
+    
+    @Slot()
     def on_stop(self):
         """Callback para parar conversão."""
-        if self.conversion_worker and self.conversion_worker.isRunning():
+        if self._parallel_stop is not None:
+            # Os arquivos em andamento têm o processo encerrado; os que ainda não começaram são descartados
+            self._parallel_stop.set()
+            self.stop_btn.setEnabled(False)
+            self._set_status_text("Parando conversão...")
+            return
+        
+        if self._serial_active:
+            # O processo externo do arquivo atual é encerrado pelo evento de parada;
+            # on_conversion_finished restaura a interface quando o worker sair do lote
             self.conversion_worker.stop()
-            self.conversion_worker.wait(3000)  # Aguarda até 3 segundos
+            self.stop_btn.setEnabled(False)
+            self._set_status_text("Parando conversão...")
+            return
         
         self.convert_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self.progress_bar.setVisible(False)
-        self.status_label.setText("Conversão interrompida")
-        self.status_bar.showMessage("Conversão parada")
+        self._set_status_text("Conversão interrompida")
+        self._show_status_message("Conversão parada")
         
-    def on_format_changed(self, format_text):
+    @Slot(int)
+    def on_format_changed(self, index):
         """Callback para mudança de formato."""
-        if format_text and not format_text.startswith("---") and format_text != "Selecione o formato...":
-            self.update_convert_button_state()
+        # O índice já chega no sinal; evita consultar o combo de novo
+        self.update_convert_button_state(self.output_format_combo.itemData(index) is not None)
+        
+    def _set_progress(self, progress):
+        """Atualiza a barra de progresso apenas quando o valor muda."""
+        if progress != self._last_progress:
+            self._last_progress = progress
+            self.progress_bar.setValue(progress)
+    
+    def _set_status_text(self, text):
+        """Atualiza o texto de status apenas quando ele muda (QLabel sempre repinta)."""
+        if text != self._last_status_text:
+            self._last_status_text = text
+            self.status_label.setText(text)
+    
+    def _show_status_message(self, message):
+        """Mostra a mensagem na barra de status, ignorando repetições da mensagem atual.
         
+        Compara com currentMessage() em vez de um valor guardado, pois dicas de
+        status (statusTip) também substituem a mensagem exibida.
+        """
+        if message != self.status_bar.currentMessage():
+            self.status_bar.showMessage(message)
+    
+    @Slot(int, str)
     def on_conversion_progress(self, progress, message):
         """Callback para atualização de progresso do conversor."""
-        self.progress_bar.setValue(progress)
-        if message:
-            self.status_label.setText(message)
+        self._pending_progress = (progress, message)
     
+    @Slot(str)
     def on_conversion_status(self, message):
         """Callback para atualização de status do conversor."""
-        self.status_bar.showMessage(message)
+        self._show_status_message(message)
     
+    @Slot(int, str)
     def on_worker_progress(self, progress, message):
-        """Callback para progresso do worker thread."""
-        self.progress_bar.setValue(progress)
+        """Callback para progresso do worker thread (guarda apenas o valor mais recente)."""
+        self._pending_progress = (progress, message)
+    
+    def _flush_progress(self):
+        """Aplica aos widgets o último progresso recebido, se houver."""
+        pending, self._pending_progress = self._pending_progress, None
+        if pending is None:
+            return
+        progress, message = pending
+        self._set_progress(progress)
         if message:
-            self.status_label.setText(message)
+            self._set_status_text(message)
     
+    @Slot(bool, str)
     def on_conversion_finished(self, success, message):
         """Callback para finalização da conversão."""
-        self.convert_btn.setEnabled(True)
+        self._progress_timer.stop()
+        self._pending_progress = None
+        self._serial_active = False
+        self.update_convert_button_state()
         self.stop_btn.setEnabled(False)
         self.progress_bar.setVisible(False)
         
         if success:
-            self.status_label.setText("Conversão concluída com sucesso!")
-            self.status_bar.showMessage(message)
+            self._set_status_text("Conversão concluída com sucesso!")
+            self._show_status_message(message)
         else:
-            self.status_label.setText("Erro na conversão")
-            self.status_bar.showMessage(f"Erro: {message}")
-        
-        # Limpar worker
-        if self.conversion_worker:
-            self.conversion_worker.deleteLater()
-            self.conversion_worker = None
+            self._set_status_text("Erro na conversão")
+            self._show_status_message("Erro: " + message)
             
+    @Slot()
     def on_browse_destination(self):
         """Callback para selecionar pasta de destino."""
-        from PySide6.QtWidgets import QFileDialog
-        
         folder = QFileDialog.getExistingDirectory(
             self,
             "Selecionar Pasta de Destino",
-            ""
+            self._last_dest
         )
         
         if folder:
+            self._last_dest = folder
+            self._settings.setValue("last_dest", folder)
             self.dest_path_label.setText(folder)
-            self.dest_path_label.setStyleSheet("color: #2c5aa0; font-style: normal; font-weight: bold;")
-            self.status_bar.showMessage(f"Pasta de destino: {folder}")
+            self._set_dest_set(True)
+            self._show_status_message(f"Pasta de destino: {folder}")
         
+    def _set_dest_set(self, dest_set: bool):
+        """Alterna o visual do rótulo de destino repolindo-o, sem reprocessar o QSS."""
+        if dest_set == self._dest_set:
+            return
+        self._dest_set = dest_set
+        self.dest_path_label.setProperty("destSet", dest_set)
+        self.dest_path_label.style().unpolish(self.dest_path_label)
+        self.dest_path_label.style().polish(self.dest_path_label)
+    
+    def _start_worker(self):
+        """Cria, conecta e inicia o worker de conversão em série."""
+        self.conversion_worker = ConversionWorker(self.converter)
+        # O slot de progresso só guarda o último valor, então roda direto na thread do worker
+        self.conversion_worker.progress_updated.connect(self.on_worker_progress, Qt.DirectConnection)
+        self.conversion_worker.conversion_finished.connect(self.on_conversion_finished, Qt.QueuedConnection)
+        self.conversion_worker.status_updated.connect(self.on_conversion_status, Qt.QueuedConnection)
+        self.conversion_worker.start()
+    
+    def closeEvent(self, event):
+        """Encerra as conversões em andamento antes de fechar a janela.
+        
+        O evento de parada encerra os processos externos dos arquivos em
+        conversão; as tarefas paralelas que ainda não começaram são descartadas.
+        A espera é limitada a _CLOSE_TIMEOUT_MS para que a janela sempre feche.
+        """
+        self._progress_timer.stop()
+        
+        # Nenhum sinal das conversões deve chegar à janela depois daqui
+        self._task_signals.task_progress.disconnect()
+        self._task_signals.task_finished.disconnect()
+        self.conversion_worker.progress_updated.disconnect()
+        self.conversion_worker.conversion_finished.disconnect()
+        self.conversion_worker.status_updated.disconnect()
+        
+        if self._parallel_stop is not None:
+            self._parallel_stop.set()
+        self._thread_pool.clear()
+        self.conversion_worker.shutdown()
+        
+        if not self.conversion_worker.wait(self._CLOSE_TIMEOUT_MS):
+            logger.warning("Worker de conversão não terminou em %d ms", self._CLOSE_TIMEOUT_MS)
+        if not self._thread_pool.waitForDone(self._CLOSE_TIMEOUT_MS):
+            logger.warning("Tarefas de conversão paralela não terminaram em %d ms", self._CLOSE_TIMEOUT_MS)
+        
+        super().closeEvent(event)
+    
     def setup_drag_drop(self):
         """Configura funcionalidade de arrastar e soltar."""
         # A funcionalidade de drag & drop agora está implementada no DragDropWidget
         pass
             
+    @Slot()
     def on_selection_changed(self):
         """Callback para mudança de seleção na lista."""
-        selected_items = self.file_list.selectedItems()
-        self.remove_files_btn.setEnabled(len(selected_items) > 0)
+        self.remove_files_btn.setEnabled(self.file_list.selectionModel().hasSelection())
         
+    def _schedule_count_update(self):
+        """Agenda a atualização da contagem, agrupando chamadas em sequência."""
+        if not self._count_timer.isActive():
+            self._count_timer.start()
+    
+    @Slot()
     def update_file_count(self):
         """Atualiza a contagem de arquivos na barra de status."""
-        count = self.file_list.count()
-        self.file_count_label.setText(f"{count} arquivo{'s' if count != 1 else ''}")
+        count = len(self._file_paths)
+        if count != self._shown_file_count:
+            self._shown_file_count = count
+            self.file_count_label.setText(
+                self._COUNT_LABELS[count] if count < len(self._COUNT_LABELS) else f"{count} arquivos"
+            )
         self.update_convert_button_state()
         
-    def update_convert_button_state(self):
-        """Atualiza o estado do botão de conversão."""
-        has_files = self.file_list.count() > 0
-        has_format = (self.output_format_combo.currentText() and 
-                     not self.output_format_combo.currentText().startswith("---") and
-                     self.output_format_combo.currentText() != "Selecione o formato...")
+    def _is_converting(self):
+        """Indica se há um lote em andamento (paralelo ou no worker em série)."""
+        return self._parallel_stop is not None or self._serial_active
+    
+    def update_convert_button_state(self, has_format=None):
+        """Atualiza o estado do botão de conversão.
         
-        self.convert_btn.setEnabled(has_files and has_format)
\ No newline at end of file
+        O botão fica desabilitado enquanto um lote estiver em andamento.
+        
+        Args:
+            has_format: Se há formato válido selecionado (consulta o combo se None)
+            
+        Returns:
+            True se o botão ficou habilitado
+        """
+        if self._is_converting():
+            enabled = False
+        else:
+            has_files = bool(self._file_paths)
+            if has_format is None:
+                has_format = self.output_format_combo.currentData() is not None
+            enabled = has_files and has_format
+        
+        if enabled != self.convert_btn.isEnabled():
+            self.convert_btn.setEnabled(enabled)
+        return enabled
\ No newline at end of file